@@ -1,9 +1,9 @@
 """Benchmark: Blitz pipeline — timed to match other language benchmarks."""
 import time
-import asyncio
 from blitztigerclaw import run
+from blitztigerclaw.utils.loop import run_loop
 
 start = time.time()
-asyncio.run(run("bench_pipeline.yaml"))
+run_loop(run("bench_pipeline.yaml"))  # same event loop as the CLI
 total = time.time() - start
 print(f"Blitz (C eng) | TOTAL: {total*1000:.0f}ms")
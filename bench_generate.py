@@ -1,33 +1,98 @@
 """Generate large test datasets for Blitz distance testing."""
 import json
+import os
 import random
 import sys
 import time
 
-def generate(n: int, path: str):
-    start = time.time()
-    data = []
-    categories = ["electronics", "clothing", "food", "tools", "books", "sports", "auto", "home"]
-    cities = ["NYC", "LA", "Chicago", "Houston", "Phoenix", "Philly", "San Antonio", "Dallas"]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CATEGORIES = ["electronics", "clothing", "food", "tools", "books", "sports", "auto", "home"]
+CITIES = ["NYC", "LA", "Chicago", "Houston", "Phoenix", "Philly", "San Antonio", "Dallas"]
+CHUNK_ROWS = 100_000
+
 
-    for i in range(n):
-        data.append({
+def _rows_numpy(start: int, n: int) -> list[dict]:
+    """Draw every column in one vectorized call, then zip into row dicts."""
+    rng = np.random.default_rng()
+    prices = rng.uniform(1.0, 999.99, n).round(2).tolist()
+    quantities = rng.integers(1, 501, n).tolist()
+    cat_idx = rng.integers(0, len(CATEGORIES), n).tolist()
+    city_idx = rng.integers(0, len(CITIES), n).tolist()
+    ratings = rng.uniform(1.0, 5.0, n).round(1).tolist()
+    in_stock = rng.integers(0, 2, n).astype(bool).tolist()
+    weights = rng.uniform(0.1, 50.0, n).round(2).tolist()
+
+    return [
+        {
+            "id": i,
+            "name": f"item_{i}",
+            "price": p,
+            "quantity": q,
+            "category": CATEGORIES[c],
+            "city": CITIES[ct],
+            "rating": r,
+            "in_stock": s,
+            "weight_kg": w,
+        }
+        for i, p, q, c, ct, r, s, w in zip(
+            range(start, start + n), prices, quantities, cat_idx, city_idx,
+            ratings, in_stock, weights,
+        )
+    ]
+
+
+def _rows_python(start: int, n: int) -> list[dict]:
+    return [
+        {
             "id": i,
             "name": f"item_{i}",
             "price": round(random.uniform(1.0, 999.99), 2),
             "quantity": random.randint(1, 500),
-            "category": random.choice(categories),
-            "city": random.choice(cities),
+            "category": random.choice(CATEGORIES),
+            "city": random.choice(CITIES),
             "rating": round(random.uniform(1.0, 5.0), 1),
             "in_stock": random.choice([True, False]),
             "weight_kg": round(random.uniform(0.1, 50.0), 2),
-        })
+        }
+        for i in range(start, start + n)
+    ]
+
+
+def _dumps(row: dict) -> bytes:
+    if orjson:
+        return orjson.dumps(row)
+    return json.dumps(row).encode()
+
+
+def generate(n: int, path: str):
+    """Write n rows as one JSON array, CHUNK_ROWS at a time.
+
+    Only one chunk of row dicts is alive at once, so peak memory no longer
+    grows with n. The output is still a plain JSON array for json.load.
+    """
+    start = time.time()
+    make_rows = _rows_numpy if np is not None else _rows_python
 
-    with open(path, "w") as f:
-        json.dump(data, f)
+    with open(path, "wb") as f:
+        f.write(b"[")
+        for offset in range(0, n, CHUNK_ROWS):
+            rows = make_rows(offset, min(CHUNK_ROWS, n - offset))
+            if offset:
+                f.write(b",")
+            f.write(b",".join(_dumps(row) for row in rows))
+        f.write(b"]")
 
     elapsed = time.time() - start
-    size_mb = len(json.dumps(data)) / (1024 * 1024)
+    size_mb = os.path.getsize(path) / (1024 * 1024)
     print(f"Generated {n:,} rows ({size_mb:.1f}MB) in {elapsed:.1f}s -> {path}")
 
 if __name__ == "__main__":
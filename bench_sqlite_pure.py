@@ -3,13 +3,30 @@ import json
 import sqlite3
 import time
 import os
+from itertools import islice
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 start = time.time()
 
-# 1. Read JSON
+# 1. Read JSON. With ijson the rows are parsed lazily while they are being
+# inserted, so only one batch is in memory and the parse time is counted
+# under Bulk Load instead of Read.
 t0 = time.time()
-with open("bench_data.json") as f:
-    data = json.load(f)
+f = open("bench_data.json", "rb")
+if ijson:
+    rows = ijson.items(f, "item", use_float=True)
+else:
+    with f:
+        rows = iter(orjson.loads(f.read()) if orjson else json.load(f))
 t_read = time.time() - t0
 
 # 2-4. Load into temp SQLite, then query out
@@ -19,10 +36,15 @@ try:
 except FileNotFoundError:
     pass
 
-conn = sqlite3.connect("bench_sqlite_pure.db")
+conn = sqlite3.connect("bench_sqlite_pure.db", isolation_level=None)
+conn.execute("PRAGMA page_size=8192")  # must precede WAL and the first CREATE TABLE
 conn.execute("PRAGMA journal_mode=WAL")
 conn.execute("PRAGMA synchronous=NORMAL")
-conn.execute("PRAGMA cache_size=-8000")
+conn.execute("PRAGMA cache_size=-65536")  # 64MB
+conn.execute("PRAGMA temp_store=MEMORY")
+conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+conn.execute("PRAGMA journal_size_limit=6144000")
+conn.execute("PRAGMA wal_autocheckpoint=100000")  # no checkpoints mid-load
 
 # Create and bulk load
 conn.execute("""CREATE TABLE raw (
@@ -30,16 +52,25 @@ conn.execute("""CREATE TABLE raw (
     category TEXT, city TEXT, rating REAL, in_stock INTEGER, weight_kg REAL
 )""")
 
-sql = "INSERT INTO raw VALUES (?,?,?,?,?,?,?,?,?)"
-batch_size = 5000
-for i in range(0, len(data), batch_size):
-    batch = data[i:i+batch_size]
-    conn.executemany(sql, [
-        (r["id"], r["name"], r["price"], r["quantity"], r["category"],
-         r["city"], r["rating"], 1 if r["in_stock"] else 0, r["weight_kg"])
-        for r in batch
-    ])
-conn.commit()
+def row_values(r):
+    return (r["id"], r["name"], r["price"], r["quantity"], r["category"],
+            r["city"], r["rating"], r["in_stock"], r["weight_kg"])
+
+# Multi-row VALUES: one statement step per 256 rows instead of per row.
+# 256 rows x 9 columns = 2304 parameters, well under SQLite's 32766 limit.
+rows_per_stmt = 256
+row_sql = "(?,?,?,?,?,?,?,?,?)"
+sql = f"INSERT INTO raw VALUES {row_sql}"
+multi_sql = f"INSERT INTO raw VALUES {','.join([row_sql] * rows_per_stmt)}"
+conn.execute("BEGIN")
+while batch := list(islice(rows, rows_per_stmt)):
+    if len(batch) == rows_per_stmt:
+        conn.execute(multi_sql, [v for r in batch for v in row_values(r)])
+    else:  # ragged tail
+        conn.executemany(sql, [row_values(r) for r in batch])
+conn.execute("COMMIT")
+conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")  # one checkpoint, after the load
+f.close()
 t_load_raw = time.time() - t0
 
 # Query: filter, compute, select, sort, limit
@@ -54,7 +85,6 @@ conn.execute("""CREATE TABLE products AS
     ORDER BY total_value DESC
     LIMIT 50000
 """)
-conn.commit()
 row_count = conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
 conn.close()
 t_query = time.time() - t0
@@ -16,5 +16,5 @@ async def run(yaml_path: str, **variables) -> Context:
 
 def run_sync(yaml_path: str, **variables) -> Context:
     """Synchronous wrapper for run()."""
-    import asyncio
-    return asyncio.run(run(yaml_path, **variables))
+    from blitztigerclaw.utils.loop import run_loop
+    return run_loop(run(yaml_path, **variables))
@@ -4,15 +4,23 @@ Saves pipeline state after each step so that failed pipelines can
 resume from the last successful step instead of restarting.
 
 State is persisted in ~/.blitztigerclaw/checkpoints/ as JSON files.
+
+v0.5.0: Data is encoded with utils.jsonio (orjson when installed), and
+every file is written to a temp file and renamed into place.
+checkpoint.json names the data file of its step, so a crash mid-save
+leaves the previous checkpoint intact.
 """
 
 from __future__ import annotations
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any
 
+from blitztigerclaw.utils.jsonio import dumps, loads
+
 CHECKPOINT_DIR = Path.home() / ".blitztigerclaw" / "checkpoints"
 
 
@@ -33,33 +41,42 @@ class CheckpointManager:
         """Save checkpoint after successful step completion."""
         self._dir.mkdir(parents=True, exist_ok=True)
 
+        # Write data separately (can be large), before the metadata that
+        # points at it
+        data_file = f"data.{step_index}.json"
+        _write_atomic(self._dir / data_file, dumps(data, default=str))
+
         state = {
             "pipeline_name": self._pipeline_name,
             "completed_step": step_index,
             "timestamp": time.time(),
             "data_count": len(data),
+            "data_file": data_file,
             "vars": _serialize_vars(vars),
             "results": results,
         }
 
-        # Write metadata
-        meta_path = self._dir / "checkpoint.json"
-        meta_path.write_text(json.dumps(state, indent=2, default=str))
+        # Write metadata: this rename is what commits the checkpoint
+        _write_atomic(self._dir / "checkpoint.json", dumps(state, indent=True, default=str))
 
-        # Write data separately (can be large)
-        data_path = self._dir / "data.json"
-        data_path.write_text(json.dumps(data, default=str))
+        # Data files of earlier checkpoints are no longer referenced
+        for f in self._dir.glob("data*.json"):
+            if f.name != data_file:
+                f.unlink(missing_ok=True)
 
     def load(self) -> dict | None:
         """Load the most recent checkpoint. Returns None if no checkpoint exists."""
         meta_path = self._dir / "checkpoint.json"
-        data_path = self._dir / "data.json"
-
-        if not meta_path.exists() or not data_path.exists():
+        if not meta_path.exists():
             return None
 
         meta = json.loads(meta_path.read_text())
-        data = json.loads(data_path.read_text())
+        data_path = self._dir / meta.get("data_file", "data.json")
+        if not data_path.exists():
+            return None
+
+        raw = data_path.read_bytes()
+        data = loads(raw)
 
         return {
             "completed_step": meta["completed_step"],
@@ -94,6 +111,14 @@ def _safe_name(name: str) -> str:
     return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
 
 
+def _write_atomic(path: Path, payload: bytes):
+    """Write to a temp file beside path, then rename over it."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
 def _serialize_vars(vars: dict) -> dict:
     """Serialize vars dict, converting non-JSON-safe values to strings."""
     result = {}
@@ -1,8 +1,8 @@
-import asyncio
 import click
 from blitztigerclaw.parser import parse_pipeline
 from blitztigerclaw.pipeline import Pipeline
 from blitztigerclaw.exceptions import BlitzError
+from blitztigerclaw.utils.loop import run_loop
 
 
 @click.group()
@@ -54,7 +54,7 @@ def run(file, var, dry_run, verbose, resume):
     pipeline = Pipeline(definition, verbose=verbose, resume=resume)
 
     try:
-        context = asyncio.run(pipeline.run())
+        context = run_loop(pipeline.run())
     except BlitzError as e:
         click.echo(f"\nError: {e}", err=True)
         if definition.checkpoint:
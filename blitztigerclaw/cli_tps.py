@@ -14,6 +14,7 @@ from blitztigerclaw.pipeline import Pipeline
 from blitztigerclaw.tps.kanban import KanbanBoard
 from blitztigerclaw.tps.linter import PipelineLinter
 from blitztigerclaw.tps.metrics import MetricsStore
+from blitztigerclaw.utils.loop import run_loop
 
 
 @click.command()
@@ -214,9 +215,11 @@ def work(limit, verbose):
 
         try:
             overrides = item.get("variables", {})
+            # Repeat items of one file reuse parse_pipeline's in-process
+            # YAML cache; vars and overrides are applied per item.
             definition = parse_pipeline(item["pipeline_file"], overrides or None)
             pipeline = Pipeline(definition, verbose=verbose, kanban_id=item["id"])
-            context = asyncio.run(pipeline.run())
+            context = run_loop(pipeline.run())
 
             summary = context.summary()
             click.echo(
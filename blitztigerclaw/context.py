@@ -19,6 +19,8 @@ class Context:
 
     v0.2.0: Added memory tracking (memory_mb, peak_buffer_rows).
     v0.4.0: Added multi-input support (inputs dict) for DAG nodes.
+    v0.5.0: Added shared_session so fetch steps reuse one HTTP pool per run.
+    v0.5.0: Added generation, bumped whenever set_data swaps in a new list.
     """
 
     data: list[dict[str, Any]] = field(default_factory=list)
@@ -33,8 +35,17 @@ class Context:
     memory_peak_mb: float = 0.0
     peak_buffer_rows: int = 0
     streaming_mode: bool = False
+    # v0.5.0: Data generation; unchanged when a step passes its input through
+    generation: int = 0
+    # v0.5.0: aiohttp.ClientSession owned by Pipeline.run (None outside a run)
+    shared_session: Any = field(default=None, repr=False)
+    # Cached row-size estimate, refreshed only when the row width changes
+    _row_size: int = field(default=0, repr=False)
+    _row_width: int = field(default=-1, repr=False)
 
     def set_data(self, data: list[dict[str, Any]]):
+        if data is not self.data:
+            self.generation += 1
         self.data = data
         self._track_memory()
 
@@ -52,15 +63,18 @@ class Context:
         ))
 
     def _track_memory(self):
-        """Track peak memory usage of the data list."""
+        """Track peak memory usage of the data list.
+
+        Row size is estimated from a single row and cached until the number of
+        keys per row changes, so set_data stays O(1) for long pipelines.
+        """
         current_mb = sys.getsizeof(self.data) / (1024 * 1024)
-        # Rough estimate: each row ~200 bytes average
         if self.data:
-            sample_size = min(100, len(self.data))
-            avg_row_size = sum(
-                sys.getsizeof(row) for row in self.data[:sample_size]
-            ) / sample_size
-            current_mb = (avg_row_size * len(self.data)) / (1024 * 1024)
+            row = self.data[0]
+            if len(row) != self._row_width:
+                self._row_width = len(row)
+                self._row_size = sys.getsizeof(row)
+            current_mb = (self._row_size * len(self.data)) / (1024 * 1024)
         if current_mb > self.memory_peak_mb:
             self.memory_peak_mb = current_mb
         if len(self.data) > self.peak_buffer_rows:
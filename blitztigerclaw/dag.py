@@ -8,6 +8,7 @@ Supports topological ordering and parallel execution grouping.
 from __future__ import annotations
 
 from collections import deque
+from itertools import count
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -39,13 +40,51 @@ class ExecutionDAG:
 
     Provides topological ordering, parallel group detection,
     and graph mutation for optimization passes.
+
+    v0.5.0: Predecessor/successor/in-edge lists are kept per node, in edge
+    order, so neighbor queries are dict lookups instead of edge scans.
+    Edges are stored in an insertion-ordered dict, so removing a node only
+    touches its own edges. Assigning to edges re-indexes them.
     """
 
-    __slots__ = ("nodes", "edges")
+    __slots__ = (
+        "nodes", "_edges", "_seq", "_next_seq",
+        "_preds", "_succs", "_in_edges", "_out_edges",
+    )
 
     def __init__(self):
         self.nodes: dict[str, DagNode] = {}
-        self.edges: list[DagEdge] = []
+        self._edges: dict[int, DagEdge] = {}  # id(edge) -> edge
+        self._seq: dict[int, int] = {}  # id(edge) -> insertion number
+        self._next_seq = count()
+        self._preds: dict[str, list[str]] = {}
+        self._succs: dict[str, list[str]] = {}
+        self._in_edges: dict[str, list[DagEdge]] = {}
+        self._out_edges: dict[str, list[DagEdge]] = {}
+
+    @property
+    def edges(self) -> list[DagEdge]:
+        """All edges in insertion order (a new list)."""
+        return list(self._edges.values())
+
+    @edges.setter
+    def edges(self, edges: list[DagEdge]) -> None:
+        self._edges = {}
+        self._seq = {}
+        self._preds = {}
+        self._succs = {}
+        self._in_edges = {}
+        self._out_edges = {}
+        for edge in edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: DagEdge) -> None:
+        self._edges[id(edge)] = edge
+        self._seq[id(edge)] = next(self._next_seq)
+        self._preds.setdefault(edge.target, []).append(edge.source)
+        self._succs.setdefault(edge.source, []).append(edge.target)
+        self._in_edges.setdefault(edge.target, []).append(edge)
+        self._out_edges.setdefault(edge.source, []).append(edge)
 
     # ------------------------------------------------------------------
     # Construction
@@ -55,7 +94,7 @@ class ExecutionDAG:
         self.nodes[node.id] = node
 
     def add_edge(self, source: str, target: str, port: str = "default") -> None:
-        self.edges.append(DagEdge(source=source, target=target, port=port))
+        self._index_edge(DagEdge(source=source, target=target, port=port))
 
     # ------------------------------------------------------------------
     # Queries
@@ -63,25 +102,23 @@ class ExecutionDAG:
 
     def predecessors(self, node_id: str) -> list[str]:
         """Node IDs that feed into this node."""
-        return [e.source for e in self.edges if e.target == node_id]
+        return list(self._preds.get(node_id, ()))
 
     def successors(self, node_id: str) -> list[str]:
         """Node IDs that this node feeds into."""
-        return [e.target for e in self.edges if e.source == node_id]
+        return list(self._succs.get(node_id, ()))
 
     def in_edges(self, node_id: str) -> list[DagEdge]:
         """All edges arriving at this node."""
-        return [e for e in self.edges if e.target == node_id]
+        return list(self._in_edges.get(node_id, ()))
 
     def roots(self) -> list[str]:
         """Nodes with no incoming edges (data sources)."""
-        targets = {e.target for e in self.edges}
-        return [nid for nid in self.nodes if nid not in targets]
+        return [nid for nid in self.nodes if not self._preds.get(nid)]
 
     def leaves(self) -> list[str]:
         """Nodes with no outgoing edges (sinks)."""
-        sources = {e.source for e in self.edges}
-        return [nid for nid in self.nodes if nid not in sources]
+        return [nid for nid in self.nodes if not self._succs.get(nid)]
 
     # ------------------------------------------------------------------
     # Ordering
@@ -89,9 +126,8 @@ class ExecutionDAG:
 
     def topological_sort(self) -> list[str]:
         """Kahn's algorithm. Raises ValueError on cycle."""
-        in_degree = {nid: 0 for nid in self.nodes}
-        for edge in self.edges:
-            in_degree[edge.target] += 1
+        preds, succs = self._preds, self._succs
+        in_degree = {nid: len(preds.get(nid, ())) for nid in self.nodes}
 
         queue = deque(nid for nid, deg in in_degree.items() if deg == 0)
         order: list[str] = []
@@ -99,7 +135,7 @@ class ExecutionDAG:
         while queue:
             nid = queue.popleft()
             order.append(nid)
-            for succ in self.successors(nid):
+            for succ in succs.get(nid, ()):
                 in_degree[succ] -= 1
                 if in_degree[succ] == 0:
                     queue.append(succ)
@@ -112,38 +148,84 @@ class ExecutionDAG:
         """Group nodes into execution levels.
 
         Nodes in the same level have no dependencies on each other
-        and can run concurrently.
+        and can run concurrently. Levels are assigned inside Kahn's loop:
+        a node's level is final when it is dequeued (all its predecessors
+        are done), so one pass yields the groups in topological order.
         """
-        order = self.topological_sort()
-        level_of: dict[str, int] = {}
+        preds, succs = self._preds, self._succs
+        in_degree = {nid: len(preds.get(nid, ())) for nid in self.nodes}
+        level_of = dict.fromkeys(self.nodes, 0)
 
-        for nid in order:
-            preds = self.predecessors(nid)
-            level_of[nid] = (max(level_of[p] for p in preds) + 1) if preds else 0
+        queue = deque(nid for nid, deg in in_degree.items() if deg == 0)
+        groups: list[list[str]] = []
+        placed = 0
 
-        by_level: dict[int, list[str]] = {}
-        for nid, lvl in level_of.items():
-            by_level.setdefault(lvl, []).append(nid)
+        while queue:
+            nid = queue.popleft()
+            level = level_of[nid]
+            if level == len(groups):
+                groups.append([])
+            groups[level].append(nid)
+            placed += 1
+            for succ in succs.get(nid, ()):
+                if level >= level_of[succ]:
+                    level_of[succ] = level + 1
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    queue.append(succ)
 
-        return [by_level[i] for i in sorted(by_level)]
+        if placed != len(self.nodes):
+            raise ValueError("ExecutionDAG contains a cycle")
+        return groups
 
     # ------------------------------------------------------------------
     # Mutation (used by optimization passes)
     # ------------------------------------------------------------------
 
     def remove_node(self, node_id: str) -> None:
-        """Remove a node and all its edges."""
+        """Remove a node and all its edges.
+
+        Work is proportional to the node's degree: only its own edges and
+        its neighbors' entries are touched.
+        """
         self.nodes.pop(node_id, None)
-        self.edges = [
-            e for e in self.edges
-            if e.source != node_id and e.target != node_id
-        ]
+        for edge in self._in_edges.pop(node_id, ()):
+            self._edges.pop(id(edge), None)
+            self._seq.pop(id(edge), None)
+        for edge in self._out_edges.pop(node_id, ()):
+            self._edges.pop(id(edge), None)
+            self._seq.pop(id(edge), None)
+        # Only the node's neighbors have entries that mention it
+        for pred in set(self._preds.pop(node_id, ())):
+            if pred != node_id:
+                self._succs[pred] = [t for t in self._succs[pred] if t != node_id]
+                self._out_edges[pred] = [
+                    e for e in self._out_edges[pred] if e.target != node_id
+                ]
+        for succ in set(self._succs.pop(node_id, ())):
+            if succ != node_id:
+                self._preds[succ] = [s for s in self._preds[succ] if s != node_id]
+                self._in_edges[succ] = [
+                    e for e in self._in_edges[succ] if e.source != node_id
+                ]
 
     def redirect_edges(self, old_source: str, new_source: str) -> None:
         """Redirect all outgoing edges from old_source to new_source."""
-        for edge in self.edges:
-            if edge.source == old_source:
-                edge.source = new_source
+        moved = self._out_edges.pop(old_source, None)
+        if not moved:
+            return
+        del self._succs[old_source]
+        for edge in moved:
+            edge.source = new_source
+        for target in {edge.target for edge in moved}:
+            self._preds[target] = [
+                new_source if s == old_source else s for s in self._preds[target]
+            ]
+        # new_source's outgoing edges, merged back into edge order
+        out = self._out_edges.get(new_source, []) + moved
+        out.sort(key=lambda e: self._seq[id(e)])
+        self._out_edges[new_source] = out
+        self._succs[new_source] = [e.target for e in out]
 
     def swap_adjacent(self, a_id: str, b_id: str) -> None:
         """Swap two adjacent nodes: (... -> A -> B -> ...) becomes (... -> B -> A -> ...).
@@ -151,7 +233,7 @@ class ExecutionDAG:
         Precondition: there is an edge A -> B and A has one successor, B has one predecessor.
         """
         new_edges = []
-        for e in self.edges:
+        for e in self._edges.values():
             if e.source == a_id and e.target == b_id:
                 # Direct link A->B becomes B->A
                 new_edges.append(DagEdge(source=b_id, target=a_id, port=e.port))
@@ -163,7 +245,7 @@ class ExecutionDAG:
                 new_edges.append(DagEdge(source=a_id, target=e.target, port=e.port))
             else:
                 new_edges.append(e)
-        self.edges = new_edges
+        self.edges = new_edges  # re-indexes
 
     # ------------------------------------------------------------------
     # Display
@@ -173,7 +255,7 @@ class ExecutionDAG:
         return len(self.nodes)
 
     def __repr__(self) -> str:
-        return f"ExecutionDAG({len(self.nodes)} nodes, {len(self.edges)} edges)"
+        return f"ExecutionDAG({len(self.nodes)} nodes, {len(self._edges)} edges)"
 
     def describe(self) -> str:
         """Human-readable DAG description."""
@@ -182,7 +264,7 @@ class ExecutionDAG:
             parallel = len(group) > 1
             for nid in group:
                 node = self.nodes[nid]
-                preds = self.predecessors(nid)
+                preds = self._preds.get(nid, ())
                 tag = " [parallel]" if parallel else ""
                 pred_str = f" <- {', '.join(preds)}" if preds else " (root)"
                 lines.append(
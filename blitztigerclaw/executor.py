@@ -17,6 +17,8 @@ from blitztigerclaw.dag import ExecutionDAG, DagNode
 from blitztigerclaw.schema import DataSchema
 from blitztigerclaw.steps import StepRegistry
 
+_TASK_GROUP = hasattr(asyncio, "TaskGroup")  # Python 3.11+
+
 
 @dataclass
 class NodeResult:
@@ -26,6 +28,7 @@ class NodeResult:
     data: list[dict[str, Any]]
     schema: DataSchema
     duration_ms: float
+    row_count: int  # len(data) when the node finished
     errors: list[str] = field(default_factory=list)
 
 
@@ -36,8 +39,10 @@ class DagExecutor:
     1. Compute parallel groups (topological levels)
     2. For each level:
        - Single node: execute directly
-       - Multiple nodes: execute concurrently via asyncio.gather
-    3. Each node gets its own isolated Context copy
+       - Multiple nodes: execute concurrently in an asyncio.TaskGroup
+         (gather on Python 3.10); the first failure cancels its siblings
+    3. Concurrent and multi-input nodes get their own isolated Context
+       copy; a node alone in its level runs on the shared Context
     4. Final result comes from the leaf node(s)
     """
 
@@ -58,16 +63,19 @@ class DagExecutor:
         for group in groups:
             if len(group) == 1:
                 node_index += 1
-                await self._execute_node(group[0], context, node_index, total)
+                await self._execute_node(
+                    group[0], context, node_index, total, isolated=False
+                )
             else:
                 # Concurrent execution of independent nodes
                 if self.verbose:
                     print(f"  [parallel: {', '.join(self.dag.nodes[n].step_type for n in group)}]")
-                tasks = []
-                for nid in group:
-                    node_index += 1
-                    tasks.append(self._execute_node(nid, context, node_index, total))
-                await asyncio.gather(*tasks)
+                start = node_index
+                node_index += len(group)
+                await _run_concurrently([
+                    self._execute_node(nid, context, start + i, total)
+                    for i, nid in enumerate(group, 1)
+                ])
 
         # Set final data from leaf node(s)
         leaves = self.dag.leaves()
@@ -87,8 +95,14 @@ class DagExecutor:
         context: Context,
         step_num: int,
         total: int,
+        isolated: bool = True,
     ) -> None:
-        """Execute a single DAG node."""
+        """Execute a single DAG node.
+
+        With isolated=False (nothing else runs concurrently) a node with at
+        most one input runs directly on the shared context: no Context
+        allocation or vars copy, since there is no one to isolate it from.
+        """
         node = self.dag.nodes[node_id]
 
         if self.verbose:
@@ -104,17 +118,24 @@ class DagExecutor:
 
         # Gather input data from predecessors
         input_data = self._gather_inputs(node_id, context)
+        if _mutates_input(node):
+            input_data = list(input_data)  # shared with other consumers
 
-        # Create isolated Context for this node
-        node_context = Context(
-            vars=dict(context.vars),
-            pipeline_name=context.pipeline_name,
-        )
-        node_context.set_data(input_data)
+        preds = self.dag.predecessors(node_id)
+        if not isolated and len(preds) <= 1:
+            node_context = context
+            context.data = input_data
+        else:
+            # Create isolated Context for this node
+            node_context = Context(
+                vars=dict(context.vars),
+                pipeline_name=context.pipeline_name,
+                shared_session=context.shared_session,
+            )
+            node_context.set_data(input_data)
 
         # For multi-input nodes, populate the inputs dict with secondary inputs.
         # Primary input (preds[0]) is already in context.data via _gather_inputs.
-        preds = self.dag.predecessors(node_id)
         if len(preds) > 1:
             primary_source = preds[0]
             in_edges = self.dag.in_edges(node_id)
@@ -133,23 +154,26 @@ class DagExecutor:
         duration_ms = (time.time() - start) * 1000
 
         # Store result
+        row_count = len(result)
         schema = DataSchema.infer(result) if result else DataSchema.unknown()
         self._results[node_id] = NodeResult(
             node_id=node_id,
             data=result,
             schema=schema,
             duration_ms=duration_ms,
+            row_count=row_count,
         )
 
         # Propagate vars back to main context
-        for k, v in node_context.vars.items():
-            context.vars[k] = v
+        if node_context is not context:
+            for k, v in node_context.vars.items():
+                context.vars[k] = v
 
         # Log step result
-        context.log_step(step_num - 1, node.step_type, len(result), duration_ms)
+        context.log_step(step_num - 1, node.step_type, row_count, duration_ms)
 
         if self.verbose:
-            print(f"{len(result)} rows in {duration_ms:.0f}ms")
+            print(f"{row_count} rows in {duration_ms:.0f}ms")
 
     def _gather_inputs(self, node_id: str, context: Context) -> list[dict]:
         """Collect input data for a node from its predecessors."""
@@ -157,7 +181,7 @@ class DagExecutor:
 
         if not preds:
             # Root node — use initial Context data
-            return list(context.data)
+            return context.data
 
         if len(preds) == 1:
             return self._results[preds[0]].data
@@ -180,18 +204,7 @@ class DagExecutor:
 
         step_class = StepRegistry.get(node.step_type)
         step = step_class(config, context)
-
-        if node.strategy == "streaming" and step.supports_streaming():
-            result = []
-            async for row in step.execute_stream():
-                result.append(row)
-            return result
-        elif node.strategy == "async":
-            return await step.execute_async()
-        elif node.strategy == "multiprocess":
-            return await step.execute_pooled()
-        else:
-            return await step.execute()
+        return await step.runner(node.strategy)()
 
     async def _execute_fused(
         self,
@@ -201,29 +214,32 @@ class DagExecutor:
         """Execute a fused node — multiple operations in one sequential pass.
 
         Avoids per-step overhead (context.set_data, metrics, checkpoint)
-        between the fused operations.
+        between the fused operations. All ops share one sub-Context; its
+        vars are merged back into the node's context once, at the end.
         """
-        fused_ops = node.config.get("_fused_ops", [])
-        data = list(context.data)
-
-        for op in fused_ops:
-            op_type = op["type"]
-            op_config = op["config"]
-
-            sub_context = Context(
-                vars=dict(context.vars),
-                pipeline_name=context.pipeline_name,
-            )
-            sub_context.set_data(data)
-
-            step_class = StepRegistry.get(op_type)
-            step = step_class(op_config, sub_context)
-            data = await step.execute()
+        sub_context = Context(
+            vars=dict(context.vars),
+            pipeline_name=context.pipeline_name,
+            shared_session=context.shared_session,
+        )
+        steps = [
+            StepRegistry.get(op["type"])(op["config"], sub_context)
+            for op in node.config.get("_fused_ops", [])
+        ]
 
-            # Propagate vars
-            for k, v in sub_context.vars.items():
-                context.vars[k] = v
+        if all(step.streams_rows() for step in steps):
+            # Chain the row generators: one pass, no list between ops
+            rows = iter(context.data)
+            for step in steps:
+                rows = step.stream_rows(rows)
+            data = list(rows)
+        else:
+            data = context.data
+            for step in steps:
+                sub_context.data = data  # each op sees earlier ops' vars
+                data = await step.execute()
 
+        context.vars.update(sub_context.vars)
         return data
 
     def get_node_result(self, node_id: str) -> NodeResult | None:
@@ -237,10 +253,43 @@ class DagExecutor:
                 "node_id": r.node_id,
                 "step_type": self.dag.nodes[r.node_id].step_type
                 if r.node_id in self.dag.nodes else "_unknown",
-                "rows": len(r.data),
+                "rows": r.row_count,
                 "duration_ms": round(r.duration_ms, 1),
                 "schema_width": r.schema.width,
                 "errors": len(r.errors),
             }
             for r in self._results.values()
         ]
+
+
+async def _run_concurrently(coros: list) -> None:
+    """Run coroutines as sibling tasks; the first failure cancels the rest
+    and is re-raised as is (not wrapped in an ExceptionGroup)."""
+    if not _TASK_GROUP:
+        tasks = [asyncio.ensure_future(c) for c in coros]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for coro in coros:
+                tg.create_task(coro)
+    except BaseExceptionGroup as group:  # noqa: F821 (3.11+ only)
+        raise group.exceptions[0] from None
+
+
+def _mutates_input(node: DagNode) -> bool:
+    """Whether the node's step (or any op of a fused node) changes its
+    input list in place (StepMeta.mutates_input)."""
+    if node.step_type == "_fused":
+        types = [op["type"] for op in node.config.get("_fused_ops", [])]
+    else:
+        types = [node.step_type]
+    try:
+        return any(StepRegistry.get_meta(t).mutates_input for t in types)
+    except ValueError:
+        return True  # unknown step: keep the defensive copy
@@ -1,10 +1,11 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from blitztigerclaw.steps import StepRegistry, discover as _discover_steps
+from blitztigerclaw.steps import StepRegistry
 
 if TYPE_CHECKING:
     from blitztigerclaw.context import Context
+    from blitztigerclaw.parser import StepDefinition
 
 
 class Optimizer:
@@ -14,46 +15,66 @@ class Optimizer:
     v0.5.0: Reads strategy from StepMeta — no hardcoded step names.
     """
 
-    def decide(self, step_type: str, config: dict, context: "Context") -> str:
-        """Returns: 'streaming', 'async', 'sync', 'multiprocess', or 'batched'."""
-        _discover_steps()
+    def __init__(self):
+        # step_type -> (default_strategy, escalations, breaker key set),
+        # filled on first use so decide() does one dict lookup per step.
+        # This is the memo: caching whole decisions per (step_type, row
+        # bucket, breakers) costs more to key than the short escalation
+        # loop it would skip.
+        self._table: dict[str, tuple[str, tuple, frozenset[str]] | None] = {}
 
+    def _entry(self, step_type: str) -> tuple[str, tuple, frozenset[str]] | None:
+        try:
+            return self._table[step_type]
+        except KeyError:
+            pass
         try:
             meta = StepRegistry.get_meta(step_type)
+            entry = (
+                meta.default_strategy,
+                meta.strategy_escalations,
+                frozenset(meta.streaming_breakers),
+            )
         except ValueError:
+            entry = None
+        self._table[step_type] = entry
+        return entry
+
+    def decide(
+        self, step_type: str, config: dict, context: "Context",
+        needs_collect: bool | None = None,
+    ) -> str:
+        """Returns: 'streaming', 'async', 'sync', 'multiprocess', or 'batched'.
+
+        Pass the step's precomputed StepDefinition.needs_collect to skip
+        checking config against the streaming breakers.
+        """
+        entry = self._entry(step_type)
+        if entry is None:
             return "sync"
+        chosen, escalations, breakers = entry
 
         # Check escalations (thresholds in ascending order)
         row_count = len(context.data)
-        chosen = meta.default_strategy
-        for threshold, strategy in meta.strategy_escalations:
-            if row_count > threshold:
-                # streaming_breakers can suppress a streaming escalation
-                if strategy == "streaming" and meta.streaming_breakers:
-                    if any(k in config for k in meta.streaming_breakers):
-                        continue
-                chosen = strategy
+        for threshold, strategy in escalations:
+            if row_count <= threshold:
+                break
+            # streaming_breakers can suppress a streaming escalation
+            if strategy == "streaming":
+                if needs_collect is None:
+                    needs_collect = not breakers.isdisjoint(config)
+                if needs_collect:
+                    continue
+            chosen = strategy
 
         return chosen
 
-    def should_stream_pipeline(self, step_configs: list[tuple[str, dict]]) -> bool:
+    def should_stream_pipeline(self, steps: list["StepDefinition"]) -> bool:
         """Decide if the entire pipeline should use streaming execution.
 
         Returns True if all steps support streaming and data is expected to be large.
+        Reads the is_streamable flags parse_pipeline set on each step.
         """
-        _discover_steps()
-
-        for step_type, config in step_configs:
-            try:
-                meta = StepRegistry.get_meta(step_type)
-            except ValueError:
-                return False
-
-            if meta.streaming == "no":
-                return False
-            # conditional streaming respects breakers
-            if meta.streaming == "conditional" and meta.streaming_breakers:
-                if any(k in config for k in meta.streaming_breakers):
-                    return False
-
-        return len(step_configs) >= 2
+        if not all(step.is_streamable for step in steps):
+            return False
+        return len(steps) >= 2
@@ -1,31 +1,51 @@
 from __future__ import annotations
 
+import functools
+import mmap
 import os
+import pickle
+import re
 import yaml
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import Any
 
 from blitztigerclaw.exceptions import ParseError
+from blitztigerclaw.steps import StepRegistry
 from blitztigerclaw.utils.url_expander import expand_vars
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
-class StepDefinition(BaseModel):
+
+@dataclass(slots=True)
+class StepDefinition:
     step_type: str
     config: dict[str, Any]
+    # Static plan facts, set once by parse_pipeline from the step's StepMeta
+    needs_collect: bool = False  # config uses a streaming breaker (sort, ...)
+    is_streamable: bool = False  # step can run in a streaming pipeline
+
 
+@dataclass(slots=True)
+class PipelineDefinition:
+    """Parsed pipeline. Plain dataclasses: parse_pipeline does the
+    validation, so construction costs nothing per field.
+    """
 
-class PipelineDefinition(BaseModel):
     name: str
     description: str = ""
-    vars: dict[str, Any] = Field(default_factory=dict)
-    steps: list[StepDefinition] = Field(default_factory=list)
+    vars: dict[str, Any] = field(default_factory=dict)
+    steps: list[StepDefinition] = field(default_factory=list)
     on_error: str = "stop"
-    plugins: list[str] = Field(default_factory=list)
+    plugins: list[str] = field(default_factory=list)
     jit: bool = False
     # v0.2.0: Checkpoint support
     checkpoint: bool = False
     # v0.4.0: Explicit DAG definition (alternative to linear steps)
-    graph: dict[str, Any] = Field(default_factory=dict)
+    graph: dict[str, Any] = field(default_factory=dict)
 
 
 def parse_pipeline(
@@ -33,20 +53,21 @@ def parse_pipeline(
 ) -> PipelineDefinition:
     """Parse a YAML pipeline file into a PipelineDefinition."""
 
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except OSError:
         raise ParseError(f"Pipeline file not found: {file_path}")
 
-    with open(file_path, "r") as f:
-        try:
-            raw = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ParseError(f"Invalid YAML: {e}")
+    # Fresh copy per call: the code below mutates vars and graph configs.
+    raw = pickle.loads(_load_yaml_blob(file_path, st.st_mtime_ns, st.st_size))
 
     if not isinstance(raw, dict):
         raise ParseError("Pipeline YAML must be a mapping (dict) at the top level")
 
     if "name" not in raw:
         raise ParseError("Pipeline must have a 'name' field")
+    if not isinstance(raw["name"], str):
+        raise ParseError("Pipeline 'name' must be a string")
 
     has_steps = "steps" in raw and raw["steps"]
     has_graph = "graph" in raw and raw["graph"]
@@ -55,14 +76,20 @@ def parse_pipeline(
         raise ParseError("Pipeline must have 'steps' or 'graph'")
 
     # Merge overrides into vars
-    variables = raw.get("vars", {})
+    variables = raw.get("vars") or {}
+    if not isinstance(variables, dict):
+        raise ParseError("Pipeline 'vars' must be a mapping")
     if overrides:
         variables.update(overrides)
 
-    # Expand environment variables in vars
+    # Expand environment variables in vars (one environ snapshot, taken
+    # only if some var references one)
+    env: dict[str, str] | None = None
     for key, value in variables.items():
-        if isinstance(value, str):
-            variables[key] = os.path.expandvars(value)
+        if isinstance(value, str) and "$" in value:
+            if env is None:
+                env = dict(os.environ)
+            variables[key] = _expand_env(value, env)
 
     # Parse steps (linear mode)
     steps = []
@@ -75,6 +102,10 @@ def parse_pipeline(
                 )
             step_type = list(step_raw.keys())[0]
             config = step_raw[step_type] or {}
+            if not isinstance(config, dict):
+                raise ParseError(
+                    f"Step {i + 1} ({step_type}): config must be a mapping"
+                )
 
             # Expand variables in string config values
             config = _expand_config(config, variables)
@@ -92,6 +123,10 @@ def parse_pipeline(
     if raw.get("plugins"):
         _load_plugins(raw["plugins"], file_path)
 
+    # After plugins, so plugin step types are registered
+    for step in steps:
+        _annotate_step(step)
+
     return PipelineDefinition(
         name=raw["name"],
         description=raw.get("description", ""),
@@ -99,28 +134,112 @@ def parse_pipeline(
         steps=steps,
         on_error=raw.get("on_error", "stop"),
         plugins=raw.get("plugins", []),
-        jit=raw.get("jit", False),
-        checkpoint=raw.get("checkpoint", False),
+        jit=bool(raw.get("jit", False)),
+        checkpoint=bool(raw.get("checkpoint", False)),
         graph=graph,
     )
 
 
+def _annotate_step(step: StepDefinition):
+    """Precompute the step's streaming flags so the optimizer never rescans
+    its config. Unknown step types keep the defaults; the run reports them.
+    """
+    try:
+        meta = StepRegistry.get_meta(step.step_type)
+    except ValueError:
+        return
+    step.needs_collect = not frozenset(meta.streaming_breakers).isdisjoint(
+        step.config
+    )
+    step.is_streamable = meta.streaming == "yes" or (
+        meta.streaming == "conditional" and not step.needs_collect
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _load_yaml_blob(file_path: str, mtime_ns: int, size: int) -> bytes:
+    """Return the pickled YAML document of file_path.
+
+    Cached in-process by (path, mtime_ns, size), so re-parsing an unchanged
+    file (watch mode, queue runners) skips the YAML parse. Only the raw
+    document is cached: variable/env expansion and plugin loading still
+    happen on every parse_pipeline call.
+    """
+    with open(file_path, "rb") as f:
+        try:
+            if size:
+                # Parse straight from the page cache; mmap can't map 0 bytes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    raw = yaml.load(mm, Loader=_SafeLoader)
+            else:
+                raw = yaml.load(f, Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            raise ParseError(f"Invalid YAML in {file_path}: {e}")
+    return pickle.dumps(raw, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# Same syntax as os.path.expandvars on POSIX: $name and ${name}
+_ENVVAR_RE = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+
+
+def _expand_env(value: str, env: dict[str, str]) -> str:
+    """os.path.expandvars against a pre-taken environ snapshot.
+
+    Unknown variables are left unchanged, as expandvars does.
+    """
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name.startswith("{"):
+            name = name[1:-1]
+        return env.get(name, match.group(0))
+
+    return _ENVVAR_RE.sub(replace, value)
+
+
 def _expand_config(config: Any, variables: dict) -> Any:
-    """Recursively expand variable references in config values.
+    """Expand variable references in config values.
 
     Also fixes YAML boolean key coercion: 'on', 'off', 'yes', 'no' are
     parsed as booleans by YAML. We convert them back to strings when
     used as dict keys.
+
+    Walks dicts/lists iteratively and rewrites them in place (the config is
+    a private copy from parse_pipeline). Strings without a '$' or '{'
+    marker are left untouched, so clean configs allocate nothing.
     """
-    if isinstance(config, str):
-        return expand_vars(config, variables)
-    if isinstance(config, dict):
-        return {
-            _fix_yaml_bool_key(k): _expand_config(v, variables)
-            for k, v in config.items()
-        }
-    if isinstance(config, list):
-        return [_expand_config(item, variables) for item in config]
+    markers = ("$", "{") if variables else ("$",)
+
+    def expand(value: Any) -> Any:
+        if isinstance(value, str) and any(m in value for m in markers):
+            return expand_vars(value, variables)
+        return value
+
+    if not isinstance(config, (dict, list)):
+        return expand(config)
+
+    seen: set[int] = set()  # YAML aliases can share one container
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, dict):
+            if any(k is True or k is False for k in node):
+                items = list(node.items())
+                node.clear()
+                node.update((_fix_yaml_bool_key(k), v) for k, v in items)
+            items = node.items()
+        else:
+            items = enumerate(node)
+        for k, v in list(items):
+            if isinstance(v, (dict, list)):
+                stack.append(v)
+            else:
+                new = expand(v)
+                if new is not v:
+                    node[k] = new
     return config
 
 
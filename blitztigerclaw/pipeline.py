@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any
 
 from blitztigerclaw.context import Context
 from blitztigerclaw.optimizer import Optimizer
@@ -11,16 +12,20 @@ from blitztigerclaw.exceptions import StepError
 from blitztigerclaw.checkpoint import CheckpointManager
 
 if TYPE_CHECKING:
-    from blitztigerclaw.parser import PipelineDefinition
+    import aiohttp
 
-from blitztigerclaw.steps import StepRegistry, discover as _discover_steps
+    from blitztigerclaw.parser import PipelineDefinition
 
-_discover_steps()
+from blitztigerclaw.steps import BaseStep, StepRegistry
 from blitztigerclaw.tps.metrics import MetricsStore
 from blitztigerclaw.tps.kanban import KanbanBoard
 from blitztigerclaw.tps.change_detector import ChangeDetector
 
 
+# Steps whose output is never JIT-hashed or flagged as MUDA
+_JIT_SKIP_TYPES = frozenset({"guard", "load"})
+
+
 class Pipeline:
     """Executes a parsed pipeline definition.
 
@@ -54,6 +59,30 @@ class Pipeline:
             if definition.checkpoint or resume
             else None
         )
+        self._plan: list[tuple[type[BaseStep], dict, str, bool]] | None = None
+
+        # Import only the step modules this pipeline references; unknown
+        # types are left for the run to report.
+        for step_type in self._step_types():
+            StepRegistry.ensure_loaded(step_type)
+
+    def _step_types(self) -> set[str]:
+        types = {s.step_type for s in self.definition.steps}
+        types.update(
+            node["step"] for node in self.definition.graph.values()
+            if isinstance(node, dict) and "step" in node
+        )
+        return types
+
+    def _compiled_plan(self) -> list[tuple[type[BaseStep], dict, str, bool]]:
+        """(step_class, config, step_type, needs_collect) per step, resolved
+        once per Pipeline."""
+        if self._plan is None:
+            self._plan = [
+                (StepRegistry.get(s.step_type), s.config, s.step_type, s.needs_collect)
+                for s in self.definition.steps
+            ]
+        return self._plan
 
     async def run(self) -> Context:
         context = Context(
@@ -95,10 +124,15 @@ class Pipeline:
                 use_legacy = True  # Checkpoint resume uses legacy path
 
         try:
-            if use_legacy:
-                await self._run_sequential(context, start_step)
-            else:
-                await self._run_dag(context)
+            async with AsyncExitStack() as stack:
+                if _uses_fetch(self.definition):
+                    context.shared_session = await stack.enter_async_context(
+                        self._open_session()
+                    )
+                if use_legacy:
+                    await self._run_sequential(context, start_step)
+                else:
+                    await self._run_dag(context)
 
         except Exception as e:
             status = "failed"
@@ -106,6 +140,13 @@ class Pipeline:
             raise
         finally:
             finished_at = time.time()
+            context.shared_session = None  # closed by the exit stack
+
+            # JIT: Persist the step hashes stored during the run
+            try:
+                self.change_detector.flush()
+            except OSError:
+                pass  # A lost hash only means the step isn't skipped next run
 
             # KAIZEN: Record metrics
             try:
@@ -157,6 +198,25 @@ class Pipeline:
 
         return context
 
+    @staticmethod
+    def _open_session() -> aiohttp.ClientSession:
+        """One HTTP session per run, shared by every fetch step.
+
+        Keeps TLS connections, keep-alive and the DNS cache warm across
+        steps. No connector limit: each step bounds its own concurrency.
+        Only opened for pipelines that fetch; aiohttp is imported here so
+        the others never load it.
+        """
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+        )
+        return aiohttp.ClientSession(connector=connector, auto_decompress=True)
+
     async def _run_dag(self, context: Context):
         """v0.4.0: DAG execution path — compile, optimize, execute."""
         planner = Planner()
@@ -195,37 +255,28 @@ class Pipeline:
 
     async def _run_sequential(self, context: Context, start_step: int = 0):
         """Standard step-by-step execution."""
-        for i, step_def in enumerate(self.definition.steps):
-            if i < start_step:
-                continue
-
-            step_name = step_def.step_type
+        plan = self._compiled_plan()
+        # JIT: hash of context.data and the generation it was computed at
+        data_hash, hashed_generation = None, -1
+        for i in range(start_step, len(plan)):
+            step_class, config, step_name, needs_collect = plan[i]
             if self.verbose:
                 print(
-                    f"  [{i + 1}/{len(self.definition.steps)}] {step_name}...",
+                    f"  [{i + 1}/{len(plan)}] {step_name}...",
                     end=" ",
                     flush=True,
                 )
 
-            step_class = StepRegistry.get(step_name)
-            step = step_class(step_def.config, context)
-
-            strategy = self.optimizer.decide(step_name, step_def.config, context)
+            step = step_class(config, context)
+            run = step.runner(
+                self.optimizer.decide(step_name, config, context, needs_collect)
+            )
 
             start = time.time()
             errors = []
 
             try:
-                if strategy == "streaming" and step.supports_streaming():
-                    result = []
-                    async for row in step.execute_stream():
-                        result.append(row)
-                elif strategy == "async":
-                    result = await step.execute_async()
-                elif strategy == "multiprocess":
-                    result = await step.execute_pooled()
-                else:
-                    result = await step.execute()
+                result = await run()
             except Exception as e:
                 # Save checkpoint on failure
                 if self.checkpoint and self.definition.checkpoint:
@@ -257,8 +308,13 @@ class Pipeline:
 
             # JIT: Check if data changed (skip downstream if unchanged)
             jit_skipped = False
-            if self.definition.jit and step_name not in ("guard", "load"):
-                current_hash = self.change_detector.compute_hash(result)
+            current_hash = None
+            if self.definition.jit and step_name not in _JIT_SKIP_TYPES:
+                if result is context.data and hashed_generation == context.generation:
+                    # Pass-through step: same list as its input, already hashed
+                    current_hash = data_hash
+                else:
+                    current_hash = self.change_detector.compute_hash(result)
                 if not self.change_detector.has_changed(
                     self.definition.name, i, current_hash
                 ):
@@ -274,13 +330,15 @@ class Pipeline:
             # MUDA: Warn on dead steps (no data produced)
             if (
                 not result
-                and step_name not in ("guard", "load")
+                and step_name not in _JIT_SKIP_TYPES
                 and self.verbose
             ):
                 print(f"(MUDA: no data) ", end="")
 
             context.set_data(result)
             context.log_step(i, step_name, len(result), duration_ms, errors)
+            if current_hash is not None:
+                data_hash, hashed_generation = current_hash, context.generation
 
             # Save checkpoint after each successful step
             if self.checkpoint and self.definition.checkpoint:
@@ -358,3 +416,24 @@ class Pipeline:
 
             if self.verbose:
                 print(f"{len(result)} rows in {duration_ms:.0f}ms")
+
+
+def _uses_fetch(definition: PipelineDefinition) -> bool:
+    """Whether any step, graph node or nested sub-step (branch routes,
+    parallel branches) is a fetch. May over-approximate: a false positive
+    only opens an unused session."""
+    if any(step.step_type == "fetch" for step in definition.steps):
+        return True
+    return _mentions_fetch([step.config for step in definition.steps]) or (
+        _mentions_fetch(definition.graph)
+    )
+
+
+def _mentions_fetch(obj: Any) -> bool:
+    if isinstance(obj, dict):
+        if "fetch" in obj or obj.get("step") == "fetch" or obj.get("type") == "fetch":
+            return True
+        return any(_mentions_fetch(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_mentions_fetch(v) for v in obj)
+    return False
@@ -16,7 +16,7 @@ import re
 from typing import Any
 
 from blitztigerclaw.dag import ExecutionDAG, DagNode, DagEdge
-from blitztigerclaw.steps import StepRegistry, discover as _discover_steps
+from blitztigerclaw.steps import StepRegistry
 
 
 class Planner:
@@ -86,7 +86,6 @@ class Planner:
 
     def optimize(self, dag: ExecutionDAG) -> ExecutionDAG:
         """Apply all optimization passes in order."""
-        _discover_steps()
         dag = self._pass_fuse_operators(dag)
         dag = self._pass_push_filters(dag)
         dag = self._pass_track_projections(dag)
@@ -145,11 +144,7 @@ class Planner:
                 # Rewire: succ's downstream now connects to node
                 dag.redirect_edges(succ_id, node_id)
                 # Remove succ and the edge between node -> succ
-                dag.edges = [
-                    e for e in dag.edges
-                    if not (e.source == node_id and e.target == succ_id)
-                ]
-                del dag.nodes[succ_id]
+                dag.remove_node(succ_id)
                 changed = True
                 break  # Restart after mutation
 
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, ClassVar
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, ClassVar, Iterable, Iterator,
+)
 
+import functools
 import importlib
 import pkgutil
 
@@ -22,9 +25,14 @@ class StepMeta:
     streaming: str = "no"  # yes|no|conditional
 
     # -- Planner --
-    fusable: bool = False  # can participate in operator fusion
+    fusable: bool = False  # can participate in operator fusion (see streams_rows)
     is_source: bool = False  # data source (no input dependency)
 
+    # -- Executor --
+    # reorders/extends/deletes from context.data in place, so it must be
+    # handed a private copy (steps that build a new list leave this False)
+    mutates_input: bool = False
+
     # -- Docs --
     description: str = ""
     config_docs: dict[str, str] = field(default_factory=dict)
@@ -33,6 +41,13 @@ class StepMeta:
     required_config: tuple[str, ...] = ()  # at least one must be present
 
 
+# strategy -> BaseStep method name; anything else runs execute()
+_STRATEGY_METHODS = {
+    "async": "execute_async",
+    "multiprocess": "execute_pooled",
+}
+
+
 class BaseStep(ABC):
     """Base class for all pipeline steps.
 
@@ -76,6 +91,50 @@ class BaseStep(ABC):
         """
         return False
 
+    def streams_rows(self) -> bool:
+        """True if this step can be chained as a row-level generator.
+
+        Executors check this before chaining the step through
+        stream_rows(); other steps are run via execute().
+        """
+        return (
+            type(self)._stream_rows is not BaseStep._stream_rows
+            and self.supports_streaming()
+        )
+
+    def stream_rows(self, rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Lazily map `rows` to this step's output rows.
+
+        Raises ValueError if the step can't stream rows (see streams_rows).
+        """
+        if not self.streams_rows():
+            raise ValueError(
+                f"Step '{type(self).__name__}' can't stream rows with this config"
+            )
+        return self._stream_rows(rows)
+
+    def _stream_rows(self, rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Row-level streaming hook: lazily map `rows` to output rows.
+
+        Override in row-level (fusable) steps. Fused nodes chain these
+        generators so rows flow through every op without an intermediate
+        list per op. Only called through stream_rows(), once streams_rows()
+        is True.
+        """
+        raise NotImplementedError
+
+    def runner(self, strategy: str) -> Callable[[], Awaitable[list[dict[str, Any]]]]:
+        """Return the bound coroutine method that runs this step under `strategy`.
+
+        Lets executors resolve the strategy once and then just ``await run()``.
+        """
+        if strategy == "streaming" and self.supports_streaming():
+            return self._collect_stream
+        return getattr(self, _STRATEGY_METHODS.get(strategy, "execute"))
+
+    async def _collect_stream(self) -> list[dict[str, Any]]:
+        return [row async for row in self.execute_stream()]
+
     def input_schema(self) -> "DataSchema | None":
         """Declare the schema this step expects as input.
 
@@ -108,13 +167,30 @@ class StepRegistry:
 
     @classmethod
     def get(cls, name: str) -> type[BaseStep]:
-        if name not in cls._registry:
+        try:
+            return cls._registry[name]  # already registered: no loading
+        except KeyError:
+            pass
+        if not cls.ensure_loaded(name):
+            discover()  # so the error lists every available type
             available = ", ".join(sorted(cls._registry.keys()))
             raise ValueError(
                 f"Unknown step type: '{name}'. Available: [{available}]"
             )
         return cls._registry[name]
 
+    @classmethod
+    def ensure_loaded(cls, name: str) -> bool:
+        """Import the built-in module for step `name` on first reference.
+
+        Built-in steps live in a module of the same name, so a pipeline only
+        imports the step modules (and their dependencies) it actually uses.
+        Returns True if `name` is registered afterwards.
+        """
+        if name not in cls._registry and name in _builtin_step_modules():
+            importlib.import_module(f"{__name__}.{name}")
+        return name in cls._registry
+
     @classmethod
     def list_types(cls) -> list[str]:
         return sorted(cls._registry.keys())
@@ -152,6 +228,16 @@ class StepRegistry:
 _discovered = False
 
 
+@functools.lru_cache(maxsize=1)
+def _builtin_step_modules() -> frozenset[str]:
+    """Names of the step modules in this package (listed, not imported)."""
+    package = importlib.import_module(__name__)
+    return frozenset(
+        info.name for info in pkgutil.iter_modules(package.__path__)
+        if not info.name.startswith("_")
+    )
+
+
 def discover() -> None:
     """Auto-import all step modules in this package to trigger registration.
 
@@ -162,8 +248,5 @@ def discover() -> None:
         return
     _discovered = True
 
-    package = importlib.import_module(__name__)
-    for info in pkgutil.iter_modules(package.__path__):
-        if info.name.startswith("_"):
-            continue
-        importlib.import_module(f"{__name__}.{info.name}")
+    for name in sorted(_builtin_step_modules()):
+        importlib.import_module(f"{__name__}.{name}")
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from operator import itemgetter
 from typing import Any
 
 from blitztigerclaw.steps import BaseStep, StepMeta, StepRegistry
@@ -68,10 +69,7 @@ class AggregateStep(BaseStep):
             parsed_funcs[alias] = (match.group(1), match.group(2))
 
         # Single-pass grouping
-        groups: dict[tuple, list[dict]] = defaultdict(list)
-        for row in data:
-            key = tuple(row.get(k) for k in group_by) if group_by else ()
-            groups[key].append(row)
+        groups = _group_rows(data, group_by)
 
         # Compute aggregates per group
         result = []
@@ -137,3 +135,32 @@ class AggregateStep(BaseStep):
             return max(values)
 
         return None
+
+
+def _group_rows(data: list[dict], group_by: list[str]) -> dict[tuple, list[dict]]:
+    """Rows per group key tuple (values of group_by, None if missing), in
+    first-seen order.
+
+    A single field is grouped by its bare value (no one-tuple per row);
+    several are read with one C-level itemgetter call per row, falling
+    back to row.get only for rows missing a field.
+    """
+    if not group_by:
+        return {(): list(data)}
+
+    if len(group_by) == 1:
+        k = group_by[0]
+        by_value: dict[Any, list[dict]] = defaultdict(list)
+        for row in data:
+            by_value[row.get(k)].append(row)
+        return {(value,): rows for value, rows in by_value.items()}
+
+    getter = itemgetter(*group_by)
+    groups: dict[tuple, list[dict]] = defaultdict(list)
+    for row in data:
+        try:
+            key = getter(row)
+        except KeyError:
+            key = tuple(row.get(k) for k in group_by)
+        groups[key].append(row)
+    return groups
@@ -6,7 +6,7 @@ All operations are row-level and streamable.
 
 from __future__ import annotations
 
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Iterable, Iterator
 
 from blitztigerclaw.steps import BaseStep, StepMeta, StepRegistry
 
@@ -76,7 +76,7 @@ class CleanStep(BaseStep):
     )
 
     async def execute(self) -> list[dict[str, Any]]:
-        data = list(self.context.data)
+        data = self.context.data  # read only: rows are collected into result
         if not data:
             return []
 
@@ -105,6 +105,10 @@ class CleanStep(BaseStep):
 
     async def execute_stream(self) -> AsyncIterator[dict[str, Any]]:
         """Streaming clean: processes rows one at a time."""
+        for row in self._stream_rows(self.context.data):
+            yield row
+
+    def _stream_rows(self, rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
         coerce = self.config.get("coerce", {})
         defaults = self.config.get("defaults", {})
         trim_fields = self.config.get("trim", [])
@@ -115,7 +119,7 @@ class CleanStep(BaseStep):
         drop_empty = self.config.get("drop_empty", [])
         rename = self.config.get("rename", {})
 
-        for row in self.context.data:
+        for row in rows:
             row = self._clean_row(
                 row, coerce, defaults, trim_fields, lowercase_fields,
                 uppercase_fields, replace_map, rename,
@@ -2,12 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import aiohttp
-from typing import Any, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterator
+
+try:
+    import ijson
+    _IJSON = True
+except ImportError:
+    _IJSON = False
 
 from blitztigerclaw.steps import BaseStep, StepMeta, StepRegistry
-from blitztigerclaw.utils.url_expander import expand_url_pattern
-from blitztigerclaw.utils.jsonpath import jsonpath_extract
-from blitztigerclaw.stream import AdaptiveSemaphore
+from blitztigerclaw.utils.url_expander import iter_expand_url_pattern
+from blitztigerclaw.utils.jsonio import loads
+from blitztigerclaw.utils.jsonpath import jsonpath_compile
+from blitztigerclaw.stream import STREAM_END
 
 
 @StepRegistry.register("fetch")
@@ -16,6 +24,10 @@ class FetchStep(BaseStep):
 
     v0.2.0: HTTP compression, DNS caching, adaptive semaphore,
     streaming execution via execute_stream + as_completed.
+    v0.5.0: Fixed pool of `parallel` workers pulling from a URL queue
+    replaces one task per URL behind a semaphore.
+    v0.5.0: URL patterns are read once in __init__ and expanded lazily
+    as workers pull from them.
     """
 
     meta = StepMeta(
@@ -33,18 +45,27 @@ class FetchStep(BaseStep):
             "headers": "dict — custom HTTP headers",
             "method": "string — HTTP method (default GET)",
             "extract": "string — JSONPath to extract from response",
+            "expect": "string — json|text: skip Content-Type sniffing (default auto)",
         },
     )
 
+    def __init__(self, config: dict[str, Any], context: "Context"):
+        super().__init__(config, context)
+        raw = config.get("urls") or config.get("url", "")
+        self._url_patterns: list[str] = raw if isinstance(raw, list) else [raw]
+        # "json"/"text" fix the body decoding; anything else sniffs Content-Type
+        self._expect: str = config.get("expect", "auto")
+
     async def execute(self) -> list[dict[str, Any]]:
         return await self.execute_async()
 
     async def execute_async(self) -> list[dict[str, Any]]:
-        urls = self._expand_urls()
+        urls = self._iter_urls()
         parallel = self.config.get("parallel", 10)
         retry_count = self.config.get("retry", 0)
         timeout = self.config.get("timeout", 30)
         extract_path = self.config.get("extract", None)
+        extract = jsonpath_compile(extract_path) if extract_path else None
         method = self.config.get("method", "GET").upper()
         headers = dict(self.config.get("headers", {}))
         body = self.config.get("body", None)
@@ -53,42 +74,24 @@ class FetchStep(BaseStep):
         if "Accept-Encoding" not in headers:
             headers["Accept-Encoding"] = "gzip, deflate, br"
 
-        semaphore = AdaptiveSemaphore(initial=parallel, max_concurrent=parallel * 3)
-        connector = aiohttp.TCPConnector(
-            limit=parallel,
-            enable_cleanup_closed=True,
-            # v0.2.0: DNS caching — avoids repeated DNS lookups
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-        )
         client_timeout = aiohttp.ClientTimeout(total=timeout)
 
         results: list[dict[str, Any]] = []
-        errors: list[str] = []
+        errors: list[str] | None = None  # allocated on the first failure
 
-        async with aiohttp.ClientSession(
-            connector=connector,
-            timeout=client_timeout,
-            # v0.2.0: Auto-decompress responses
-            auto_decompress=True,
-        ) as session:
-            tasks = [
-                self._fetch_one(
-                    session, url, method, headers, body,
-                    semaphore, retry_count
-                )
-                for url in urls
-            ]
-
-            # v0.2.0: Use as_completed for streaming results as they arrive
-            for coro in asyncio.as_completed(tasks):
-                try:
-                    resp = await coro
-                except Exception as e:
-                    errors.append(str(e))
+        async with self._session(parallel) as session:
+            # v0.2.0: Results are consumed as they arrive
+            async for resp in self._iter_responses(
+                session, urls, parallel,
+                method, headers, body, retry_count, client_timeout,
+            ):
+                if isinstance(resp, Exception):
+                    if errors is None:
+                        errors = []
+                    errors.append(str(resp))
                     continue
 
-                self._extract_and_append(resp, extract_path, results)
+                self._extract_and_append(resp, extract, results)
 
         if errors:
             self.context.vars["_fetch_errors"] = errors
@@ -97,11 +100,12 @@ class FetchStep(BaseStep):
 
     async def execute_stream(self) -> AsyncIterator[dict[str, Any]]:
         """Streaming fetch: yields rows as responses complete."""
-        urls = self._expand_urls()
+        urls = self._iter_urls()
         parallel = self.config.get("parallel", 10)
         retry_count = self.config.get("retry", 0)
         timeout = self.config.get("timeout", 30)
         extract_path = self.config.get("extract", None)
+        extract = jsonpath_compile(extract_path) if extract_path else None
         method = self.config.get("method", "GET").upper()
         headers = dict(self.config.get("headers", {}))
         body = self.config.get("body", None)
@@ -109,51 +113,120 @@ class FetchStep(BaseStep):
         if "Accept-Encoding" not in headers:
             headers["Accept-Encoding"] = "gzip, deflate, br"
 
-        semaphore = AdaptiveSemaphore(initial=parallel, max_concurrent=parallel * 3)
-        connector = aiohttp.TCPConnector(
-            limit=parallel,
-            enable_cleanup_closed=True,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-        )
         client_timeout = aiohttp.ClientTimeout(total=timeout)
 
-        async with aiohttp.ClientSession(
-            connector=connector,
-            timeout=client_timeout,
-            auto_decompress=True,
-        ) as session:
-            tasks = [
-                self._fetch_one(
-                    session, url, method, headers, body,
-                    semaphore, retry_count
-                )
-                for url in urls
-            ]
+        # "$.a.b[*]" streams list elements straight off the socket with ijson,
+        # so a large response is never held in memory as a whole.
+        prefix = _ijson_prefix(extract_path) if _IJSON and extract_path else None
 
-            for coro in asyncio.as_completed(tasks):
-                try:
-                    resp = await coro
-                except Exception:
+        async with self._session(parallel) as session:
+            async for resp in self._iter_responses(
+                session, urls, parallel,
+                method, headers, body, retry_count, client_timeout,
+                stream_prefix=prefix,
+            ):
+                if isinstance(resp, Exception):
+                    continue
+
+                if prefix is not None:
+                    yield resp if isinstance(resp, dict) else {"value": resp}
                     continue
 
                 items: list[dict[str, Any]] = []
-                self._extract_and_append(resp, extract_path, items)
+                self._extract_and_append(resp, extract, items)
                 for item in items:
                     yield item
 
     def supports_streaming(self) -> bool:
         return True
 
+    @asynccontextmanager
+    async def _session(self, parallel: int) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the run's shared session, or a private one outside a Pipeline.
+
+        The shared session is owned (and closed) by Pipeline.run.
+        """
+        shared = self.context.shared_session
+        if shared is not None and not shared.closed:
+            yield shared
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=parallel,
+            enable_cleanup_closed=True,
+            # v0.2.0: DNS caching — avoids repeated DNS lookups
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+        )
+        # v0.2.0: Auto-decompress responses
+        async with aiohttp.ClientSession(
+            connector=connector, auto_decompress=True
+        ) as session:
+            yield session
+
+    async def _iter_responses(
+        self, session: aiohttp.ClientSession, urls: Iterator[str], parallel: int,
+        *request_args: Any, stream_prefix: str | None = None,
+    ) -> AsyncIterator[Any]:
+        """Yield decoded responses in completion order, or the Exception a
+        failed URL raised in its place (gather(return_exceptions=True)
+        style: no (value, error) tuple per response).
+
+        `parallel` workers pull URLs from the shared `urls` iterator, so a
+        slow or retrying request only occupies its own worker and only
+        `parallel` tasks exist regardless of how many URLs there are. With
+        `stream_prefix`, each yielded value is one ijson item rather than a
+        whole response.
+        """
+        # Bounded so streamed items apply backpressure to the workers
+        done: asyncio.Queue = asyncio.Queue(maxsize=max(64, parallel * 4))
+
+        async def worker():
+            # next() never awaits, so workers can share one iterator
+            for url in urls:
+                try:
+                    if stream_prefix is None:
+                        await done.put(
+                            await self._fetch_one(session, url, *request_args)
+                        )
+                    else:
+                        async for item in self._stream_items(
+                            session, url, stream_prefix, *request_args
+                        ):
+                            await done.put(item)
+                except Exception as e:
+                    await done.put(e)
+            await done.put(STREAM_END)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(max(1, parallel))
+        ]
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = await done.get()
+                if item is STREAM_END:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     def _extract_and_append(
         self,
         resp: Any,
-        extract_path: str | None,
+        extract: Callable[[Any], Any] | None,
         results: list[dict[str, Any]],
     ):
-        """Extract data from a response and append to results list."""
-        if extract_path:
-            extracted = jsonpath_extract(resp, extract_path)
+        """Extract data from a response and append it to the results list.
+
+        `extract` is the step's compiled JSONPath (see jsonpath_compile).
+        """
+        if extract is not None:
+            extracted = extract(resp)
             if isinstance(extracted, list):
                 results.extend(
                     item if isinstance(item, dict) else {"value": item}
@@ -176,33 +249,161 @@ class FetchStep(BaseStep):
     async def _fetch_one(
         self, session: aiohttp.ClientSession,
         url: str, method: str, headers: dict,
-        body: Any, semaphore: AdaptiveSemaphore,
-        retries: int,
+        body: Any, retries: int, timeout: aiohttp.ClientTimeout,
     ):
-        async with semaphore:
-            last_error = None
-            for attempt in range(retries + 1):
-                try:
-                    async with session.request(
-                        method, url, headers=headers, json=body
-                    ) as resp:
-                        resp.raise_for_status()
-                        content_type = resp.content_type or ""
-                        if "json" in content_type:
-                            return await resp.json()
-                        text = await resp.text()
-                        return {"_url": url, "_body": text}
-                except Exception as e:
-                    last_error = e
-                    if attempt < retries:
-                        await asyncio.sleep(2**attempt * 0.5)
-            raise last_error
-
-    def _expand_urls(self) -> list[str]:
-        raw = self.config.get("urls") or self.config.get("url", "")
-        if isinstance(raw, list):
-            expanded = []
-            for u in raw:
-                expanded.extend(expand_url_pattern(u))
-            return expanded
-        return expand_url_pattern(raw)
+        last_error = None
+        for attempt in range(retries + 1):
+            try:
+                async with session.request(
+                    method, url, headers=headers, json=body,
+                    timeout=timeout,
+                ) as resp:
+                    resp.raise_for_status()
+                    if self._is_json(resp):
+                        # Decode the raw bytes directly (orjson when available)
+                        return loads(await resp.read())
+                    text = await resp.text()
+                    return {"_url": url, "_body": text}
+            except Exception as e:
+                last_error = e
+                if attempt < retries:
+                    await asyncio.sleep(2**attempt * 0.5)
+        raise last_error
+
+    async def _stream_items(
+        self, session: aiohttp.ClientSession,
+        url: str, prefix: str, method: str, headers: dict,
+        body: Any, retries: int, timeout: aiohttp.ClientTimeout,
+    ) -> AsyncIterator[Any]:
+        """Yield the elements under `prefix` while the body downloads.
+
+        Retries only before the first item is yielded; a failure mid-body
+        is raised so rows are never emitted twice. The head of the body is
+        probed first (see _prefix_matches) so the rows always equal what
+        execute() extracts from the same response.
+        """
+        last_error = None
+        for attempt in range(retries + 1):
+            emitted = False
+            try:
+                async with session.request(
+                    method, url, headers=headers, json=body,
+                    timeout=timeout,
+                ) as resp:
+                    resp.raise_for_status()
+                    # Non-JSON bodies have nothing to extract (as in _fetch_one)
+                    if not self._is_json(resp):
+                        return
+                    reader = _RewindableReader(resp.content)
+                    if not await _prefix_matches(reader, prefix):
+                        # A list where the path needs an object: the extract
+                        # maps over it, which an ijson prefix can't express.
+                        # Decode the whole body and extract, as execute() does.
+                        extract = jsonpath_compile(self.config["extract"])
+                        extracted = extract(loads(await reader.read_rest()))
+                        if isinstance(extracted, list):
+                            for item in extracted:
+                                emitted = True
+                                yield item
+                        return
+                    reader.rewind()
+                    async for item in ijson.items_async(
+                        reader, prefix, use_float=True
+                    ):
+                        emitted = True
+                        yield item
+                    return
+            except Exception as e:
+                if emitted:
+                    raise
+                last_error = e
+                if attempt < retries:
+                    await asyncio.sleep(2**attempt * 0.5)
+        raise last_error
+
+    def _is_json(self, resp: aiohttp.ClientResponse) -> bool:
+        expect = self._expect
+        if expect == "json":
+            return True
+        if expect == "text":
+            return False
+        # Raw header: the common exact type is one startswith, no parsing
+        ct = resp.headers.get("Content-Type", "")
+        if ct.startswith("application/json"):
+            return True
+        return "json" in ct.partition(";")[0]  # +json, text/json, ...
+
+    def _iter_urls(self) -> Iterator[str]:
+        for pattern in self._url_patterns:
+            yield from iter_expand_url_pattern(pattern)
+
+
+def _ijson_prefix(path: str) -> str | None:
+    """Map "$.a.b[*]" to the ijson prefix "a.b.item"; None if not streamable.
+
+    Only plain key paths ending in a single [*] are mapped: those are known
+    to yield list elements, which is what execute_stream emits as rows.
+    The prefix only matches when the root and every level above the list
+    are objects; _prefix_matches checks that per response.
+    """
+    if not path.startswith("$") or not path.endswith("[*]"):
+        return None
+    keys = path[1:-3].lstrip(".")
+    if any(c in keys for c in "[]*"):
+        return None
+    return f"{keys}.item" if keys else "item"
+
+
+async def _prefix_matches(reader: "_RewindableReader", prefix: str) -> bool:
+    """Parse the head of the body until the list under `prefix` starts.
+
+    False if an array shows up where the path expects an object (the root
+    or an intermediate key): jsonpath maps over such lists, so ijson's
+    prefix would miss rows. True otherwise, including when the list is
+    absent (both paths then extract nothing).
+    """
+    keys = prefix.split(".")[:-1]  # drop the trailing "item"
+    target = ".".join(keys)
+    objects = {".".join(keys[:i]) for i in range(len(keys))}
+    async for path, event, _ in ijson.parse_async(reader, use_float=True):
+        if event == "start_array":
+            if path == target:
+                return True
+            if path in objects:
+                return False
+    return True
+
+
+class _RewindableReader:
+    """Async reader over a response body that records what it reads, so
+    the body can be parsed again from the start (rewind) or decoded whole
+    (read_rest) after probing its head."""
+
+    __slots__ = ("_content", "_head", "_replay", "_pos")
+
+    def __init__(self, content: aiohttp.StreamReader):
+        self._content = content
+        self._head: list[bytes] | None = []
+        self._replay = b""
+        self._pos = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        if self._pos < len(self._replay):
+            end = len(self._replay) if n < 0 else self._pos + n
+            chunk = self._replay[self._pos : end]
+            self._pos += len(chunk)
+            return chunk
+        chunk = await self._content.read(n)
+        if self._head is not None:
+            self._head.append(chunk)
+        return chunk
+
+    def rewind(self):
+        """Serve everything read so far again, then the rest; stop recording."""
+        self._replay = b"".join(self._head)
+        self._pos = 0
+        self._head = None
+
+    async def read_rest(self) -> bytes:
+        """The whole body: what was read so far plus the unread remainder."""
+        return b"".join(self._head) + await self._content.read()
@@ -1,23 +1,39 @@
 from __future__ import annotations
 
+import asyncio
 import csv
+import fnmatch
+import functools
 import glob
-import json
 import os
-from typing import Any
+import re
+import stat
+from typing import Any, AsyncIterator, Iterator
 
 try:
-    import orjson
-    _ORJSON = True
+    import ijson
+    _IJSON = True
 except ImportError:
-    _ORJSON = False
+    _IJSON = False
 
 from blitztigerclaw.steps import BaseStep, StepMeta, StepRegistry
+from blitztigerclaw.utils.jsonio import loads, write_json
+
+# JSON arrays at least this large are parsed incrementally (with ijson), so
+# the raw file bytes and the parsed rows are never in memory together.
+_STREAM_JSON_BYTES = 64 * 1024 * 1024
+
+# Buffer for CSV input and output (the io default is 8 KiB)
+_CSV_BUFFER = 1 << 20
 
 
 @StepRegistry.register("file")
 class FileStep(BaseStep):
-    """Read files as pipeline input or write pipeline data to files."""
+    """Read files as pipeline input or write pipeline data to files.
+
+    v0.5.0: Large JSON arrays are parsed row by row with ijson, and
+    execute_stream yields rows of a JSON array as they are decoded.
+    """
 
     meta = StepMeta(
         is_source=True,
@@ -37,11 +53,26 @@ class FileStep(BaseStep):
         elif action == "glob":
             return self._glob()
         elif action == "write":
-            return self._write()
+            # Blocking file I/O: keep it off the event loop
+            return await asyncio.to_thread(self._write)
         else:
             raise ValueError(f"Unknown file action: {action}")
 
-    def _read(self) -> list[dict]:
+    async def execute_stream(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield the rows of a JSON array file as ijson decodes them."""
+        path, fmt = self._read_target()
+        if not (fmt == "json" and _IJSON and _json_root(path) == b"["):
+            for row in await self.execute():
+                yield row
+            return
+        with open(path, "rb") as f:
+            for row in ijson.items(f, "item", use_float=True):
+                yield row
+
+    def supports_streaming(self) -> bool:
+        return _IJSON and self.config.get("action", "read") == "read"
+
+    def _read_target(self) -> tuple[str, str]:
         path = self.config.get("path", "")
         fmt = self.config.get("format", "auto")
 
@@ -52,22 +83,27 @@ class FileStep(BaseStep):
                 fmt = "csv"
             else:
                 fmt = "text"
+        return path, fmt
+
+    def _read(self) -> list[dict]:
+        path, fmt = self._read_target()
 
         if fmt == "json":
-            if _ORJSON:
+            if (
+                _IJSON
+                and os.path.getsize(path) >= _STREAM_JSON_BYTES
+                and _json_root(path) == b"["
+            ):
                 with open(path, "rb") as f:
-                    data = orjson.loads(f.read())
-            else:
-                with open(path, "r") as f:
-                    data = json.load(f)
+                    return list(ijson.items(f, "item", use_float=True))
+            with open(path, "rb") as f:
+                data = loads(f.read())
             if isinstance(data, list):
                 return data
             return [data]
 
         elif fmt == "csv":
-            with open(path, "r") as f:
-                reader = csv.DictReader(f)
-                return list(reader)
+            return _read_csv(path)
 
         elif fmt == "text":
             with open(path, "r") as f:
@@ -82,11 +118,10 @@ class FileStep(BaseStep):
             {
                 "path": p,
                 "name": os.path.basename(p),
-                "size": os.path.getsize(p),
-                "ext": os.path.splitext(p)[1],
+                "size": size,
+                "ext": _ext(os.path.basename(p)),
             }
-            for p in sorted(glob.glob(pattern, recursive=True))
-            if os.path.isfile(p)
+            for p, size in sorted(_glob_files(pattern))
         ]
 
     def _write(self) -> list[dict]:
@@ -103,12 +138,164 @@ class FileStep(BaseStep):
         os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
         if fmt == "json":
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            write_json(path, data)
         elif fmt == "csv" and data:
-            with open(path, "w", newline="") as f:
+            with open(path, "w", newline="", buffering=_CSV_BUFFER) as f:
                 writer = csv.DictWriter(f, fieldnames=list(data[0].keys()))
                 writer.writeheader()
                 writer.writerows(data)
 
         return data
+
+
+def _read_csv(path: str) -> list[dict]:
+    """csv.DictReader semantics on top of the plain csv.reader.
+
+    Rows are built with dict(zip()) over one shared header tuple; short
+    rows get None for missing fields and long rows keep their extra
+    values under the None key, exactly as DictReader does.
+    """
+    with open(path, "r", newline="", buffering=_CSV_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        cols = tuple(header)
+        width = len(cols)
+
+        rows = []
+        append = rows.append
+        for values in reader:
+            if len(values) == width and width:
+                append(dict(zip(cols, values)))
+            elif values:  # blank lines are skipped
+                row = dict(zip(cols, values))
+                if len(values) > width:
+                    row[None] = values[width:]
+                else:
+                    for col in cols[len(values):]:
+                        row[col] = None
+                append(row)
+        return rows
+
+
+def _json_root(path: str) -> bytes:
+    """First non-whitespace byte of a JSON file (b"" if empty)."""
+    with open(path, "rb") as f:
+        while chunk := f.read(4096):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1]
+    return b""
+
+
+def _glob_files(pattern: str) -> Iterator[tuple[str, int]]:
+    """(path, size) for every regular file matching a recursive glob pattern.
+
+    Same matches as glob.glob(pattern, recursive=True) filtered by
+    os.path.isfile, but walks with os.scandir so the file type and stat
+    data come from each DirEntry instead of separate isfile/getsize calls.
+    "**" does not descend into symlinked directories.
+    """
+    parts = pattern.split("/")
+    i = 0
+    while i < len(parts) and not glob.has_magic(parts[i]):
+        i += 1
+    if i == len(parts):  # no wildcards: a plain path
+        yield from _stat_file(pattern)
+        return
+    head = "/".join(parts[:i])
+    if i == 1 and parts[0] == "":
+        head = "/"
+    yield from _walk(head, parts[i:])
+
+
+def _walk(dirpath: str, parts: list[str]) -> Iterator[tuple[str, int]]:
+    part, rest = parts[0], parts[1:]
+
+    if part == "**":
+        if len(rest) == 1 and rest[0] != "**" and glob.has_magic(rest[0]):
+            yield from _walk_files(dirpath, rest[0])
+            return
+        if rest:
+            yield from _walk(dirpath, rest)  # "**" matching zero directories
+        for entry in _scandir(dirpath):
+            if entry.name.startswith("."):
+                continue
+            path = os.path.join(dirpath, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(path, parts)
+            elif not rest and entry.is_file():
+                yield path, entry.stat().st_size
+        return
+
+    if not glob.has_magic(part):
+        path = os.path.join(dirpath, part)
+        if rest:
+            if os.path.isdir(path):
+                yield from _walk(path, rest)
+        else:
+            yield from _stat_file(path)
+        return
+
+    match = _compile_part(part)
+    hidden_ok = part.startswith(".")
+    for entry in _scandir(dirpath):
+        name = entry.name
+        if (name.startswith(".") and not hidden_ok) or not match(name):
+            continue
+        path = os.path.join(dirpath, name)
+        if rest:
+            if entry.is_dir():
+                yield from _walk(path, rest)
+        elif entry.is_file():
+            yield path, entry.stat().st_size
+
+
+def _walk_files(dirpath: str, part: str) -> Iterator[tuple[str, int]]:
+    """"**/<part>" with one scandir per directory: each listing is used both
+    to match files here and to find the subdirectories to descend into."""
+    match = _compile_part(part)
+    hidden_ok = part.startswith(".")
+    for entry in _scandir(dirpath):
+        name = entry.name
+        hidden = name.startswith(".")
+        if not hidden and entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(os.path.join(dirpath, name), part)
+        elif (hidden_ok or not hidden) and match(name) and entry.is_file():
+            yield os.path.join(dirpath, name), entry.stat().st_size
+
+
+def _scandir(dirpath: str) -> list[os.DirEntry]:
+    try:
+        with os.scandir(dirpath or ".") as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _stat_file(path: str) -> Iterator[tuple[str, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    if stat.S_ISREG(st.st_mode):
+        yield path, st.st_size
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_part(part: str):
+    """Name matcher for one wildcard path component. A literal tail such as
+    the ".csv" of "*.csv" is checked with str.endswith before the regex."""
+    match = re.compile(fnmatch.translate(part)).match
+    suffix = part[max(part.rfind(c) for c in "*?[]") + 1:]
+    if not suffix:
+        return match
+    return lambda name: name.endswith(suffix) and match(name)
+
+
+def _ext(name: str) -> str:
+    """os.path.splitext(name)[1] for a bare file name."""
+    stem = name.lstrip(".")
+    i = stem.rfind(".")
+    return stem[i:] if i != -1 else ""
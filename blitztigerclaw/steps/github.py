@@ -6,10 +6,10 @@ Wraps the `gh` CLI to check notifications, issues, PRs, repos, and workflows.
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
 from blitztigerclaw.steps import BaseStep, StepMeta, StepRegistry
+from blitztigerclaw.utils.jsonio import loads
 
 
 @StepRegistry.register("github")
@@ -88,27 +88,26 @@ class GitHubStep(BaseStep):
         )
 
         try:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            stdout, stderr = await asyncio.wait_for(_read_output(proc), timeout=30)
         except asyncio.TimeoutError:
             proc.kill()
             await proc.communicate()
             return [{"_error": "GitHub command timed out", "_action": action}]
 
-        output = stdout.decode("utf-8", errors="replace").strip()
-
-        # Try parsing as JSON
+        # Try parsing as JSON (straight from the raw stdout bytes)
         try:
-            data = json.loads(output)
+            data = loads(stdout)
             if isinstance(data, list):
                 if data and isinstance(data[0], dict):
                     return data
                 return [{"value": item} for item in data]
             if isinstance(data, dict):
                 return [data]
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             pass
 
-        # Parse line-based output
+        # Parse line-based output (only decoded when it isn't JSON)
+        output = stdout.decode("utf-8", errors="replace").strip()
         if output:
             return [
                 {"_action": action, "line": line, "_index": i}
@@ -121,3 +120,24 @@ class GitHubStep(BaseStep):
             return [{"_action": action, "_error": err}]
 
         return [{"_action": action, "_status": "no_data"}]
+
+
+async def _read_output(
+    proc: asyncio.subprocess.Process, chunk_size: int = 256 * 1024
+) -> tuple[bytearray, bytes]:
+    """Read a subprocess's stdout in chunks into one growing buffer.
+
+    Unlike communicate(), the chunks are appended in place rather than
+    joined into a second full-size copy at EOF. stderr is drained
+    concurrently so neither pipe can fill up and stall the process.
+    """
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    try:
+        stdout = bytearray()
+        while chunk := await proc.stdout.read(chunk_size):
+            stdout += chunk
+        stderr = await stderr_task
+    finally:
+        stderr_task.cancel()
+    await proc.wait()
+    return stdout, stderr
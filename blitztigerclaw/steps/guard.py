@@ -6,7 +6,14 @@ Validates data schema, required fields, row counts, nulls, and anomalies.
 
 from __future__ import annotations
 
-from typing import Any
+from collections import Counter
+from typing import Any, Callable
+
+try:
+    import fastjsonschema
+    _FASTJSONSCHEMA = True
+except ImportError:
+    _FASTJSONSCHEMA = False
 
 from blitztigerclaw.steps import BaseStep, StepMeta, StepRegistry
 from blitztigerclaw.exceptions import QualityGateError, AndonAlert
@@ -20,6 +27,39 @@ TYPE_MAP = {
     "dict": dict,
 }
 
+# Only int/float fields can fail a schema check (a value that is neither
+# the type nor coercible to it); other declared types are never errors.
+_CHECKED_TYPES = {"int": "integer", "float": "number"}
+
+# frozenset(schema.items()) -> compiled fastjsonschema validator (or None)
+_json_schema_validators: dict[frozenset, Callable[[Any], Any] | None] = {}
+
+
+def _compiled_validator(schema: dict[str, str]) -> Callable[[Any], Any] | None:
+    """Row validator accepting only rows whose checked fields are already
+    of the right type (or null); compiled once per distinct schema.
+
+    A row it rejects may still pass after coercion, so rejected rows go
+    through the per-cell check. None when fastjsonschema isn't installed.
+    """
+    key = frozenset(schema.items())
+    try:
+        return _json_schema_validators[key]
+    except KeyError:
+        pass
+    validator = None
+    if _FASTJSONSCHEMA:
+        validator = fastjsonschema.compile({
+            "type": "object",
+            "properties": {
+                field: {"type": [_CHECKED_TYPES[name], "null"]}
+                for field, name in schema.items()
+                if name in _CHECKED_TYPES
+            },
+        })
+    _json_schema_validators[key] = validator
+    return validator
+
 
 @StepRegistry.register("guard")
 class GuardStep(BaseStep):
@@ -75,35 +115,60 @@ class GuardStep(BaseStep):
         return data
 
     def _validate_schema(self, data: list[dict]) -> list[str]:
-        """POKA-YOKE: Validate field types against schema definition."""
-        schema = self.config["schema"]
-        errors = []
-        sample_size = min(len(data), 100)
+        """POKA-YOKE: Validate field types against schema definition.
 
-        for i, row in enumerate(data[:sample_size]):
-            for field, expected_type_name in schema.items():
+        Only int/float fields can fail. With fastjsonschema, rows are first
+        run through a cached compiled validator and only the rows it
+        rejects are checked cell by cell; coercible values still pass and
+        errors are reported in row order as before.
+        """
+        schema = self.config["schema"]
+        checked = [
+            (col, field, name)
+            for col, (field, name) in enumerate(schema.items())
+            if name in _CHECKED_TYPES
+        ]
+        if not checked:
+            return []
+
+        rows = list(enumerate(data[:100]))
+        validate = _compiled_validator(schema)
+        if validate is not None:
+            rows = [(i, row) for i, row in rows if not _passes(validate, row)]
+
+        suspects: list[tuple[int, int, str, str, Any]] = []
+        for col, field, expected_type_name in checked:
+            expected_type = TYPE_MAP[expected_type_name]
+            ok_types: set[type] = {type(None)}
+            for i, row in rows:
                 if field not in row:
                     continue
                 value = row[field]
-                if value is None:
+                if type(value) in ok_types:
                     continue
+                if isinstance(value, expected_type):
+                    ok_types.add(type(value))
+                    continue
+                suspects.append((i, col, field, expected_type_name, value))
 
-                expected_type = TYPE_MAP.get(expected_type_name)
-                if expected_type and not isinstance(value, expected_type):
-                    # Try coercion
-                    try:
-                        if expected_type_name == "int":
-                            int(value)
-                        elif expected_type_name == "float":
-                            float(value)
-                    except (ValueError, TypeError):
-                        errors.append(
-                            f"Row {i}: '{field}' expected {expected_type_name}, "
-                            f"got {type(value).__name__} ({value!r})"
-                        )
-                        if len(errors) >= 10:
-                            errors.append("(truncated, more errors exist)")
-                            return errors
+        errors = []
+        for i, _, field, expected_type_name, value in sorted(
+            suspects, key=lambda s: (s[0], s[1])
+        ):
+            # Try coercion
+            try:
+                if expected_type_name == "int":
+                    int(value)
+                elif expected_type_name == "float":
+                    float(value)
+            except (ValueError, TypeError):
+                errors.append(
+                    f"Row {i}: '{field}' expected {expected_type_name}, "
+                    f"got {type(value).__name__} ({value!r})"
+                )
+                if len(errors) >= 10:
+                    errors.append("(truncated, more errors exist)")
+                    return errors
 
         return errors
 
@@ -113,10 +178,16 @@ class GuardStep(BaseStep):
         if isinstance(required, str):
             required = [required]
 
+        # Complete rows cost one C-level set difference; only rows with
+        # gaps walk the field list (in config order, for the messages)
+        required_set = frozenset(required)
         errors = []
         for i, row in enumerate(data):
+            missing = required_set.difference(row)
+            if not missing:
+                continue
             for field in required:
-                if field not in row:
+                if field in missing:
                     errors.append(f"Row {i}: missing required field '{field}'")
                     if len(errors) >= 10:
                         errors.append("(truncated)")
@@ -149,9 +220,14 @@ class GuardStep(BaseStep):
         if isinstance(fields, str):
             fields = [fields]
 
+        # One pass over the rows for all fields
+        null_counts = Counter(
+            field for row in data for field in fields if row.get(field) is None
+        )
+
         errors = []
         for field in fields:
-            null_count = sum(1 for row in data if row.get(field) is None)
+            null_count = null_counts[field]
             if null_count > 0:
                 errors.append(
                     f"Field '{field}' has {null_count} null values "
@@ -169,14 +245,18 @@ class GuardStep(BaseStep):
         try:
             from blitztigerclaw.tps.metrics import MetricsStore
 
-            metrics = MetricsStore()
             pipeline_name = self.context.vars.get(
                 "_pipeline_name", self.context.pipeline_name
             )
             if not pipeline_name:
                 return []
 
-            averages = await metrics.get_step_averages(pipeline_name)
+            # Served from the process-wide averages cache when fresh
+            metrics = MetricsStore()
+            try:
+                averages = await metrics.get_step_averages(pipeline_name)
+            finally:
+                await metrics.close()
             if not averages:
                 return []  # No history yet
 
@@ -195,3 +275,11 @@ class GuardStep(BaseStep):
             pass  # Don't fail the pipeline if metrics are unavailable
 
         return errors
+
+
+def _passes(validate: Callable[[Any], Any], row: dict) -> bool:
+    try:
+        validate(row)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
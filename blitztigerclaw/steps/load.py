@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import csv
-import json
 import os
-from typing import Any, AsyncIterator
+import sqlite3
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterator
 
 from blitztigerclaw.steps import BaseStep, StepMeta, StepRegistry
 from blitztigerclaw.stream import BatchBuffer
+from blitztigerclaw.utils.jsonio import write_json
+
+# Write buffer for CSV output (the io default is 8 KiB)
+_CSV_BUFFER = 1 << 20
+
+# typed: true — values bound to SQLite natively, and the column type each implies
+_NATIVE_TYPES = (int, float)
+_AFFINITY = {int: "INTEGER", float: "REAL"}
+
+# v0.2.0: Performance PRAGMAs, sent as one script
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-8000;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+"""
 
 
 @StepRegistry.register("load")
@@ -15,6 +34,10 @@ class LoadStep(BaseStep):
 
     v0.2.0: SQLite WAL mode + PRAGMAs for 2-5x write performance,
     streaming batch inserts via execute_stream.
+    v0.5.0: SQLite loads run on a stdlib sqlite3 connection in a worker
+    thread, in one explicit transaction; async_driver: true keeps aiosqlite.
+    Batches are converted column by column; typed: true keeps ints/floats
+    native under INTEGER/REAL column affinity.
     """
 
     meta = StepMeta(
@@ -29,6 +52,8 @@ class LoadStep(BaseStep):
             "mode": "string — 'insert', 'upsert', or 'replace' (SQLite)",
             "key": "string — upsert key column",
             "batch_size": "int — rows per batch insert (default 500)",
+            "async_driver": "bool — use aiosqlite instead of sqlite3 in a worker thread (default false)",
+            "typed": "bool — infer INTEGER/REAL/TEXT columns and store numbers natively (default false: all TEXT)",
         },
     )
 
@@ -42,9 +67,9 @@ class LoadStep(BaseStep):
         if target.startswith("sqlite:"):
             await self._load_sqlite(target, data)
         elif target.startswith("csv://") or target.endswith(".csv"):
-            self._load_csv(target, data)
+            await asyncio.to_thread(self._load_csv, target, data)
         elif target.startswith("json://") or target.endswith(".json"):
-            self._load_json(target, data)
+            await asyncio.to_thread(self._load_json, target, data)
         elif target == "stdout":
             self._load_stdout(data)
         else:
@@ -73,140 +98,122 @@ class LoadStep(BaseStep):
         return target.startswith("sqlite:")
 
     async def _load_sqlite(self, target: str, data: list[dict]):
-        import aiosqlite
-
-        db_path = target.replace("sqlite:///", "").replace("sqlite://", "")
-        table = self.config.get("table", "data")
-        mode = self.config.get("mode", "insert")
-        key = self.config.get("key", None)
+        db_path, create_sql, sql, params = self._sqlite_plan(target, data)
         batch_size = self.config.get("batch_size", 1000)
 
-        columns = list(data[0].keys())
-
-        # Ensure directory exists
-        db_dir = os.path.dirname(db_path)
-        if db_dir:
-            os.makedirs(db_dir, exist_ok=True)
+        if not self.config.get("async_driver", False):
+            await asyncio.get_running_loop().run_in_executor(
+                None, _load_sqlite_sync,
+                db_path, create_sql, sql, params, data, batch_size,
+            )
+            return
 
-        async with aiosqlite.connect(db_path) as db:
-            # v0.2.0: Performance PRAGMAs
-            await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute("PRAGMA synchronous=NORMAL")
-            await db.execute("PRAGMA cache_size=-8000")
-            await db.execute("PRAGMA temp_store=MEMORY")
-            await db.execute("PRAGMA mmap_size=268435456")  # 256MB mmap
+        import aiosqlite
 
-            # Auto-create table
-            col_defs = ", ".join(
-                f'"{c}" TEXT' if c != key else f'"{c}" TEXT PRIMARY KEY'
-                for c in columns
-            )
-            await db.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({col_defs})')
-
-            col_list = ", ".join(f'"{c}"' for c in columns)
-            placeholders = ", ".join("?" for _ in columns)
-
-            if mode == "upsert" and key:
-                update_cols = ", ".join(
-                    f'"{c}" = excluded."{c}"' for c in columns if c != key
-                )
-                sql = (
-                    f'INSERT INTO "{table}" ({col_list}) VALUES ({placeholders}) '
-                    f'ON CONFLICT("{key}") DO UPDATE SET {update_cols}'
-                )
-            elif mode == "replace":
-                sql = f'INSERT OR REPLACE INTO "{table}" ({col_list}) VALUES ({placeholders})'
-            else:
-                sql = f'INSERT INTO "{table}" ({col_list}) VALUES ({placeholders})'
-
-            # Batched executemany for performance
-            for i in range(0, len(data), batch_size):
-                batch = data[i : i + batch_size]
-                values = [
-                    tuple(str(row.get(c, "")) if row.get(c) is not None else None
-                          for c in columns)
-                    for row in batch
-                ]
-                await db.executemany(sql, values)
+        async with aiosqlite.connect(db_path, isolation_level=None) as db:
+            await db.executescript(_PRAGMAS)
+            await db.execute(create_sql)
 
-            await db.commit()
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                # Batched executemany for performance
+                for i in range(0, len(data), batch_size):
+                    await db.executemany(sql, params(data[i : i + batch_size]))
+            except BaseException:
+                await db.execute("ROLLBACK")
+                raise
+            await db.execute("COMMIT")
 
     async def _load_sqlite_streaming(self, target: str, data: list[dict]):
         """Streaming SQLite inserts using BatchBuffer."""
+        if not data:
+            return
+
+        if not self.config.get("async_driver", False):
+            await self._load_sqlite(target, data)
+            return
+
         import aiosqlite
 
+        db_path, create_sql, sql, params = self._sqlite_plan(target, data)
+        batch_size = self.config.get("batch_size", 1000)
+
+        async with aiosqlite.connect(db_path, isolation_level=None) as db:
+            await db.executescript(_PRAGMAS)
+            await db.execute(create_sql)
+
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                buffer = BatchBuffer(size=batch_size)
+
+                for row in data:
+                    buffer.add(row)
+                    if buffer.full:
+                        await db.executemany(sql, params(buffer.flush()))
+
+                # Flush remaining
+                if buffer.count > 0:
+                    await db.executemany(sql, params(buffer.flush()))
+            except BaseException:
+                await db.execute("ROLLBACK")
+                raise
+            await db.execute("COMMIT")
+
+    def _sqlite_plan(
+        self, target: str, data: list[dict]
+    ) -> tuple[str, str, str, Callable[[list[dict]], Iterator[tuple]]]:
+        """Resolve the database path (creating its directory) and build the
+        CREATE TABLE and insert statements: (db_path, create_sql, sql, params),
+        where params(batch) yields the insert parameter tuples for a batch.
+        """
         db_path = target.replace("sqlite:///", "").replace("sqlite://", "")
         table = self.config.get("table", "data")
         mode = self.config.get("mode", "insert")
         key = self.config.get("key", None)
-        batch_size = self.config.get("batch_size", 1000)
-
-        if not data:
-            return
+        typed = bool(self.config.get("typed", False))
 
         columns = list(data[0].keys())
 
+        # Ensure directory exists
         db_dir = os.path.dirname(db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
 
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute("PRAGMA synchronous=NORMAL")
-            await db.execute("PRAGMA cache_size=-8000")
-            await db.execute("PRAGMA temp_store=MEMORY")
-            await db.execute("PRAGMA mmap_size=268435456")
-
+        # Auto-create table
+        if typed:
+            # INT rather than INTEGER for the key: same affinity, but not a
+            # rowid alias, so a non-integer key still inserts
+            col_defs = ", ".join(
+                f'"{c}" {aff}' if c != key
+                else f'"{c}" {"INT" if aff == "INTEGER" else aff} PRIMARY KEY'
+                for c in columns
+                for aff in (_column_affinity(data, c),)
+            )
+        else:
             col_defs = ", ".join(
                 f'"{c}" TEXT' if c != key else f'"{c}" TEXT PRIMARY KEY'
                 for c in columns
             )
-            await db.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({col_defs})')
-
-            col_list = ", ".join(f'"{c}"' for c in columns)
-            placeholders = ", ".join("?" for _ in columns)
-
-            if mode == "upsert" and key:
-                update_cols = ", ".join(
-                    f'"{c}" = excluded."{c}"' for c in columns if c != key
-                )
-                sql = (
-                    f'INSERT INTO "{table}" ({col_list}) VALUES ({placeholders}) '
-                    f'ON CONFLICT("{key}") DO UPDATE SET {update_cols}'
-                )
-            elif mode == "replace":
-                sql = f'INSERT OR REPLACE INTO "{table}" ({col_list}) VALUES ({placeholders})'
-            else:
-                sql = f'INSERT INTO "{table}" ({col_list}) VALUES ({placeholders})'
-
-            buffer = BatchBuffer(size=batch_size)
-
-            for row in data:
-                buffer.add(row)
-                if buffer.full:
-                    batch = buffer.flush()
-                    values = [
-                        tuple(
-                            str(r.get(c, "")) if r.get(c) is not None else None
-                            for c in columns
-                        )
-                        for r in batch
-                    ]
-                    await db.executemany(sql, values)
-
-            # Flush remaining
-            if buffer.count > 0:
-                batch = buffer.flush()
-                values = [
-                    tuple(
-                        str(r.get(c, "")) if r.get(c) is not None else None
-                        for c in columns
-                    )
-                    for r in batch
-                ]
-                await db.executemany(sql, values)
-
-            await db.commit()
+        create_sql = f'CREATE TABLE IF NOT EXISTS "{table}" ({col_defs})'
+
+        col_list = ", ".join(f'"{c}"' for c in columns)
+        placeholders = ", ".join("?" for _ in columns)
+
+        if mode == "upsert" and key:
+            update_cols = ", ".join(
+                f'"{c}" = excluded."{c}"' for c in columns if c != key
+            )
+            sql = (
+                f'INSERT INTO "{table}" ({col_list}) VALUES ({placeholders}) '
+                f'ON CONFLICT("{key}") DO UPDATE SET {update_cols}'
+            )
+        elif mode == "replace":
+            sql = f'INSERT OR REPLACE INTO "{table}" ({col_list}) VALUES ({placeholders})'
+        else:
+            sql = f'INSERT INTO "{table}" ({col_list}) VALUES ({placeholders})'
+
+        params = partial(_column_params, columns=tuple(columns), typed=typed)
+        return db_path, create_sql, sql, params
 
     def _load_csv(self, target: str, data: list[dict]):
         path = target.replace("csv://", "")
@@ -215,7 +222,7 @@ class LoadStep(BaseStep):
         columns = list(data[0].keys())
         mode = "a" if self.config.get("mode") == "append" else "w"
 
-        with open(path, mode, newline="") as f:
+        with open(path, mode, newline="", buffering=_CSV_BUFFER) as f:
             writer = csv.DictWriter(f, fieldnames=columns)
             if mode == "w" or os.path.getsize(path) == 0:
                 writer.writeheader()
@@ -225,8 +232,7 @@ class LoadStep(BaseStep):
         path = target.replace("json://", "")
         os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        write_json(path, data)
 
     def _load_stdout(self, data: list[dict]):
         limit = self.config.get("preview", 20)
@@ -238,25 +244,83 @@ class LoadStep(BaseStep):
 
         columns = list(shown[0].keys())
 
-        # Calculate column widths
-        widths = {c: len(c) for c in columns}
-        for row in shown:
-            for c in columns:
-                val = str(row.get(c, ""))
-                widths[c] = min(max(widths[c], len(val)), 40)
+        # Stringify each cell once; widths come from the same strings
+        cells = [[str(row.get(c, "")) for c in columns] for row in shown]
+        widths = [
+            min(max(len(c), max(len(r[i]) for r in cells)), 40)
+            for i, c in enumerate(columns)
+        ]
+
+        # One format string pads and truncates every cell to its width
+        fmt = " | ".join(f"{{:<{w}.{w}}}" for w in widths)
 
         # Print header
-        header = " | ".join(c.ljust(widths[c])[:widths[c]] for c in columns)
+        header = fmt.format(*columns)
         print(f"  {header}")
         print(f"  {'-' * len(header)}")
 
         # Print rows
-        for row in shown:
-            line = " | ".join(
-                str(row.get(c, "")).ljust(widths[c])[:widths[c]]
-                for c in columns
-            )
-            print(f"  {line}")
+        for values in cells:
+            print(f"  {fmt.format(*values)}")
 
         if len(data) > limit:
             print(f"  ... and {len(data) - limit} more rows")
+
+
+def _load_sqlite_sync(
+    db_path: str,
+    create_sql: str,
+    sql: str,
+    params: Callable[[list[dict]], Iterator[tuple]],
+    data: list[dict],
+    batch_size: int,
+):
+    """Blocking SQLite load for a worker thread: one connection in
+    autocommit mode, PRAGMAs in a single script, and every row inserted
+    inside one explicit BEGIN IMMEDIATE ... COMMIT."""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.executescript(_PRAGMAS)
+        conn.execute(create_sql)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for i in range(0, len(data), batch_size):
+                conn.executemany(sql, params(data[i : i + batch_size]))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def _column_params(
+    rows: list[dict], columns: tuple[str, ...], typed: bool = False
+) -> Iterator[tuple]:
+    """Insert parameters for a batch, built column-at-a-time.
+
+    Each column is gathered and coerced in one list comprehension, then
+    the columns are zipped back into row tuples. Values become str() and
+    missing/None become NULL; with typed, ints and floats are bound as-is.
+    """
+    cols = []
+    for c in columns:
+        if typed:
+            cols.append([
+                v if (v := r.get(c)) is None or type(v) in _NATIVE_TYPES else str(v)
+                for r in rows
+            ])
+        else:
+            cols.append([
+                None if (v := r.get(c)) is None else str(v) for r in rows
+            ])
+    return zip(*cols)
+
+
+def _column_affinity(rows: list[dict], column: str) -> str:
+    """SQLite type for a column, from its first non-null value."""
+    for row in rows:
+        value = row.get(column)
+        if value is not None:
+            return _AFFINITY.get(type(value), "TEXT")
+    return "TEXT"
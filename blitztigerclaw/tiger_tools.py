@@ -299,6 +299,7 @@ def handle_run_pipeline(input: dict) -> str:
     """Execute a pipeline and return summary."""
     from blitztigerclaw.parser import parse_pipeline
     from blitztigerclaw.pipeline import Pipeline
+    from blitztigerclaw.utils.loop import run_loop
     from blitztigerclaw.exceptions import BlitzError
 
     file_path = input["file"]
@@ -311,7 +312,7 @@ def handle_run_pipeline(input: dict) -> str:
 
     try:
         pipeline = Pipeline(definition, verbose=False)
-        context = asyncio.run(pipeline.run())
+        context = run_loop(pipeline.run())
         summary = context.summary()
         return json.dumps({
             "status": "completed",
@@ -438,6 +439,7 @@ def handle_execute_queue(input: dict) -> str:
     """Process pending KANBAN queue items."""
     from blitztigerclaw.parser import parse_pipeline
     from blitztigerclaw.pipeline import Pipeline
+    from blitztigerclaw.utils.loop import run_loop
     from blitztigerclaw.tps.kanban import KanbanBoard
 
     kanban = KanbanBoard()
@@ -457,7 +459,7 @@ def handle_execute_queue(input: dict) -> str:
             overrides = item.get("variables", {})
             definition = parse_pipeline(item["pipeline_file"], overrides or None)
             pipeline = Pipeline(definition, verbose=False, kanban_id=item["id"])
-            context = asyncio.run(pipeline.run())
+            context = run_loop(pipeline.run())
             summary = context.summary()
             results.append({
                 "id": item["id"],
@@ -568,6 +570,7 @@ def handle_resume_pipeline(input: dict) -> str:
     """Resume a failed pipeline from its last checkpoint."""
     from blitztigerclaw.parser import parse_pipeline
     from blitztigerclaw.pipeline import Pipeline
+    from blitztigerclaw.utils.loop import run_loop
     from blitztigerclaw.exceptions import BlitzError
 
     file_path = input["file"]
@@ -580,7 +583,7 @@ def handle_resume_pipeline(input: dict) -> str:
 
     try:
         pipeline = Pipeline(definition, verbose=False, resume=True)
-        context = asyncio.run(pipeline.run())
+        context = run_loop(pipeline.run())
         summary = context.summary()
         return json.dumps({
             "status": "completed",
@@ -6,6 +6,9 @@ Also provides pipeline-level deduplication (MUDA).
 
 v0.2.0: Incremental hashing (streams data without full serialization)
         + orjson fast serialization (optional dep, falls back to json).
+v0.5.0: The store is re-read only when the file's mtime changes, and
+        save_hash writes are deferred until flush() (end of the run).
+        Rows are hashed in serialized chunks, with BLAKE3 when installed.
 """
 
 from __future__ import annotations
@@ -25,6 +28,11 @@ try:
     def _dumps_str(obj: Any) -> str:
         return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
 
+    def _dumps_store(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+
 except ImportError:
     def _dumps(obj: Any) -> bytes:
         return json.dumps(obj, sort_keys=True, default=str).encode()
@@ -32,6 +40,24 @@ except ImportError:
     def _dumps_str(obj: Any) -> str:
         return json.dumps(obj, sort_keys=True, default=str)
 
+    def _dumps_store(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+# BLAKE3 (SIMD) when installed; SHA-256 otherwise. Hashes from the two
+# differ, so switching just makes the next JIT run see every step changed.
+try:
+    from blake3 import blake3 as _new_hasher
+except ImportError:
+    _new_hasher = hashlib.sha256
+
+# Rows serialized per hasher update: one C-level dumps call per chunk
+# instead of one per row, while the bytes held at once stay bounded.
+# Packing dict rows into NumPy columns first is slower: pulling each
+# column out of the dicts costs about as much as encoding the rows.
+_HASH_CHUNK_ROWS = 4096
+
 
 HASH_FILE = Path.home() / ".blitztigerclaw" / "hashes.json"
 
@@ -42,29 +68,48 @@ class ChangeDetector:
     def __init__(self, path: str | Path = HASH_FILE):
         self.path = Path(path)
         self._cache: dict | None = None
+        self._cache_mtime: int | None = None  # st_mtime_ns the cache matches
+        self._dirty = False  # cache holds hashes not yet written
+
+    def _mtime(self) -> int | None:
+        try:
+            return self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def _load(self) -> dict:
-        if self._cache is not None:
+        # Unflushed hashes win over the file; otherwise re-read only if
+        # another process rewrote it since we last read or wrote it.
+        if self._dirty:
             return self._cache
-        if self.path.exists():
-            self._cache = json.loads(self.path.read_text())
-        else:
-            self._cache = {}
+        mtime = self._mtime()
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+        self._cache = _loads(self.path.read_bytes()) if mtime is not None else {}
+        self._cache_mtime = mtime
         return self._cache
 
     def _save(self, data: dict):
         self._cache = data
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(data, indent=2))
+        self.path.write_bytes(_dumps_store(data))
+        self._cache_mtime = self._mtime()
+        self._dirty = False
+
+    def flush(self):
+        """Write hashes stored by save_hash since the last write, if any."""
+        if self._dirty:
+            self._save(self._cache)
 
     def compute_hash(self, data: list[dict[str, Any]]) -> str:
-        """Incremental SHA-256: streams row-by-row instead of serializing all at once.
+        """Incremental hash: streams fixed-size row chunks instead of
+        serializing all at once.
 
         ~3-5x faster than full JSON serialization for large datasets.
         """
-        hasher = hashlib.sha256()
-        for row in data:
-            hasher.update(_dumps(row))
+        hasher = _new_hasher()
+        for i in range(0, len(data), _HASH_CHUNK_ROWS):
+            hasher.update(_dumps(data[i : i + _HASH_CHUNK_ROWS]))
         return hasher.hexdigest()[:16]
 
     def has_changed(
@@ -80,11 +125,14 @@ class ChangeDetector:
         return previous != current_hash
 
     def save_hash(self, pipeline_name: str, step_index: int, hash_val: str):
-        """Store the hash after a successful step execution."""
+        """Store the hash after a successful step execution.
+
+        Kept in memory until flush(); has_changed sees it immediately.
+        """
         store = self._load()
         key = f"{pipeline_name}:step_{step_index}"
         store[key] = hash_val
-        self._save(store)
+        self._dirty = True
 
     def get_pipeline_hash(self, pipeline_yaml_str: str) -> str:
         """Hash the entire pipeline definition for deduplication (MUDA)."""
@@ -94,7 +142,6 @@ class ChangeDetector:
         """Clear stored hashes. If pipeline_name given, clear only that pipeline."""
         if pipeline_name is None:
             self._save({})
-            self._cache = None
             return
 
         store = self._load()
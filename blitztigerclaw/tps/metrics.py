@@ -5,6 +5,11 @@ Provides performance trends, bottleneck detection, and historical averages.
 
 v0.2.0: Connection reuse (single connection per MetricsStore instance),
         SQLite PRAGMAs for write performance, memory tracking.
+v0.5.0: Process-wide cache of step averages (including empty history),
+        so Andon checks skip the database on repeat runs.
+        record_run buffers runs and inserts them with one executemany +
+        commit per batch (flushed by size, age, reads, and close()).
+        Step averages are aggregated in SQL with JSON1 (json_each).
 """
 
 from __future__ import annotations
@@ -15,8 +20,54 @@ from pathlib import Path
 
 import aiosqlite
 
+from blitztigerclaw.utils.jsonio import dumps
+
 METRICS_DB = Path.home() / ".blitztigerclaw" / "metrics.db"
 
+# Seconds a get_step_averages result (empty or not) is served from memory
+AVERAGES_TTL = 30.0
+
+# (db path, pipeline name, window) -> (time.monotonic() stored, averages)
+_averages_cache: dict[tuple[str, str, int], tuple[float, dict[str, dict]]] = {}
+
+# Buffered runs are flushed once this many are pending, or when the last
+# flush is older than FLUSH_INTERVAL seconds (so sparse runs commit at once)
+FLUSH_EVERY = 32
+FLUSH_INTERVAL = 1.0
+
+INSERT_RUN = """INSERT INTO pipeline_runs
+   (pipeline_name, pipeline_hash, started_at, finished_at,
+    total_rows, total_duration_ms, status, error_message, steps_json,
+    memory_peak_mb, peak_buffer_rows)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Per step type totals over the last `window` completed runs, aggregated
+# by SQLite's JSON1 functions instead of parsing steps_json in Python.
+# Ordered by first appearance (newest run first), like a dict built in a loop.
+STEP_TOTALS = """SELECT
+       COALESCE(json_extract(s.value, '$.step_type'), 'unknown') AS st,
+       SUM(COALESCE(json_extract(s.value, '$.row_count'), 0)),
+       SUM(COALESCE(json_extract(s.value, '$.duration_ms'), 0)),
+       COUNT(*)
+   FROM (SELECT steps_json,
+                ROW_NUMBER() OVER (ORDER BY started_at DESC) AS rn
+         FROM pipeline_runs
+         WHERE pipeline_name = ? AND status = 'completed'
+         ORDER BY started_at DESC LIMIT ?) AS r,
+        json_each(r.steps_json) AS s
+   GROUP BY st
+   ORDER BY MIN(r.rn * 1000000 + s.key)"""
+
+# Prepared statements kept per connection (sqlite3 re-parses on a miss)
+STATEMENT_CACHE = 256
+
+PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-8000;
+PRAGMA temp_store=MEMORY;
+"""
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS pipeline_runs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -42,28 +93,45 @@ class MetricsStore:
 
     v0.2.0: Reuses a single connection for the lifetime of the store,
     avoiding repeated open/close overhead.
+    v0.5.0: With buffered=True (the default) recorded runs are batched and
+    inserted together; buffered=False commits each run before record_run
+    returns.
     """
 
-    def __init__(self, db_path: str | Path = METRICS_DB):
+    def __init__(self, db_path: str | Path = METRICS_DB, buffered: bool = True):
         self.db_path = Path(db_path)
+        self.buffered = buffered
         self._conn: aiosqlite.Connection | None = None
+        self._pending: list[tuple] = []
+        self._last_flush = time.monotonic()
 
     async def _get_conn(self) -> aiosqlite.Connection:
         if self._conn is None:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._conn = await aiosqlite.connect(str(self.db_path))
-            # Performance PRAGMAs
-            await self._conn.execute("PRAGMA journal_mode=WAL")
-            await self._conn.execute("PRAGMA synchronous=NORMAL")
-            await self._conn.execute("PRAGMA cache_size=-8000")  # 8MB
-            await self._conn.execute("PRAGMA temp_store=MEMORY")
-            await self._conn.executescript(SCHEMA)
+            self._conn = await aiosqlite.connect(
+                str(self.db_path), cached_statements=STATEMENT_CACHE
+            )
+            # Performance PRAGMAs + schema in one round trip to the thread
+            await self._conn.executescript(PRAGMAS + SCHEMA)
         return self._conn
 
     async def close(self):
-        if self._conn is not None:
-            await self._conn.close()
-            self._conn = None
+        try:
+            await self.flush()
+        finally:
+            if self._conn is not None:
+                await self._conn.close()
+                self._conn = None
+
+    async def flush(self):
+        """Insert and commit all buffered runs."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        db = await self._get_conn()
+        await db.executemany(INSERT_RUN, pending)
+        await db.commit()
 
     async def record_run(
         self,
@@ -79,13 +147,11 @@ class MetricsStore:
         memory_peak_mb: float = 0,
         peak_buffer_rows: int = 0,
     ):
-        db = await self._get_conn()
-        await db.execute(
-            """INSERT INTO pipeline_runs
-               (pipeline_name, pipeline_hash, started_at, finished_at,
-                total_rows, total_duration_ms, status, error_message, steps_json,
-                memory_peak_mb, peak_buffer_rows)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        """Buffer a run; it is written once FLUSH_EVERY runs are pending,
+        the last flush is FLUSH_INTERVAL seconds old, on any read, or on
+        close(). With buffered=False it is committed immediately.
+        """
+        self._pending.append(
             (
                 pipeline_name,
                 pipeline_hash,
@@ -95,15 +161,26 @@ class MetricsStore:
                 total_duration_ms,
                 status,
                 error_message,
-                json.dumps(steps, default=str),
+                dumps(steps, default=str).decode(),
                 memory_peak_mb,
                 peak_buffer_rows,
-            ),
+            )
         )
-        await db.commit()
+        if (
+            not self.buffered
+            or len(self._pending) >= FLUSH_EVERY
+            or time.monotonic() - self._last_flush > FLUSH_INTERVAL
+        ):
+            await self.flush()
+
+        # New history for this pipeline: drop its cached averages
+        db_key = str(self.db_path)
+        for key in [k for k in _averages_cache if k[:2] == (db_key, pipeline_name)]:
+            del _averages_cache[key]
 
     async def get_history(self, pipeline_name: str, limit: int = 20) -> list[dict]:
         """Get recent runs for a pipeline."""
+        await self.flush()
         db = await self._get_conn()
         db.row_factory = aiosqlite.Row
         cursor = await db.execute(
@@ -140,38 +217,35 @@ class MetricsStore:
 
         Used by JIDOKA Andon for anomaly detection.
         Returns: {step_type: {avg_rows, avg_ms, run_count}}
+
+        Results are cached for AVERAGES_TTL seconds (an empty result too)
+        and dropped when record_run adds a run for the pipeline. A cache
+        hit doesn't open the database connection.
         """
+        cache_key = (str(self.db_path), pipeline_name, window)
+        cached = _averages_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < AVERAGES_TTL:
+            return cached[1]
+
+        averages = await self._query_step_averages(pipeline_name, window)
+        _averages_cache[cache_key] = (time.monotonic(), averages)
+        return averages
+
+    async def _query_step_averages(
+        self, pipeline_name: str, window: int
+    ) -> dict[str, dict]:
+        await self.flush()
         db = await self._get_conn()
-        cursor = await db.execute(
-            """SELECT steps_json FROM pipeline_runs
-               WHERE pipeline_name = ? AND status = 'completed'
-               ORDER BY started_at DESC LIMIT ?""",
-            (pipeline_name, window),
-        )
+        cursor = await db.execute(STEP_TOTALS, (pipeline_name, window))
         rows = await cursor.fetchall()
 
-        if not rows:
-            return {}
-
-        # Aggregate step metrics
-        step_totals: dict[str, dict] = {}
-        for (steps_json,) in rows:
-            steps = json.loads(steps_json)
-            for step in steps:
-                st = step.get("step_type", "unknown")
-                if st not in step_totals:
-                    step_totals[st] = {"total_rows": 0, "total_ms": 0.0, "count": 0}
-                step_totals[st]["total_rows"] += step.get("row_count", 0)
-                step_totals[st]["total_ms"] += step.get("duration_ms", 0)
-                step_totals[st]["count"] += 1
-
         return {
             st: {
-                "avg_rows": round(v["total_rows"] / v["count"]),
-                "avg_ms": round(v["total_ms"] / v["count"], 1),
-                "run_count": v["count"],
+                "avg_rows": round(total_rows / count),
+                "avg_ms": round(total_ms / count, 1),
+                "run_count": count,
             }
-            for st, v in step_totals.items()
+            for st, total_rows, total_ms, count in rows
         }
 
     async def detect_bottlenecks(self, pipeline_name: str) -> list[dict]:
@@ -218,6 +292,7 @@ class MetricsStore:
 
     async def get_all_metrics_summary(self) -> list[dict]:
         """Summary across all pipelines for `blitztigerclaw metrics`."""
+        await self.flush()
         db = await self._get_conn()
         cursor = await db.execute(
             """SELECT
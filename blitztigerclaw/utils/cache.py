@@ -1,11 +1,16 @@
 import hashlib
-import json
 import os
 import time
 
+from blitztigerclaw.utils.jsonio import dumps, loads
+
 
 class FileCache:
-    """Simple file-based cache with TTL for fetch results."""
+    """Simple file-based cache with TTL for fetch results.
+
+    v0.5.0: Entries are read and written with utils.jsonio (orjson when
+    installed).
+    """
 
     def __init__(self, cache_dir: str = ".blitztigerclaw_cache", ttl: int = 3600):
         self.cache_dir = cache_dir
@@ -13,18 +18,22 @@ class FileCache:
 
     def get(self, key: str):
         path = self._path(key)
-        if not os.path.exists(path):
+        try:
+            mtime = os.stat(path).st_mtime  # one syscall: existence + age
+        except FileNotFoundError:
             return None
-        if time.time() - os.path.getmtime(path) > self.ttl:
+        if time.time() - mtime > self.ttl:
             os.unlink(path)
             return None
-        with open(path, "r") as f:
-            return json.load(f)
+        # One read of the raw bytes, parsed without decoding to str first
+        with open(path, "rb") as f:
+            return loads(f.read())
 
     def set(self, key: str, value):
+        payload = dumps(value)  # encode first: no empty entry on failure
         os.makedirs(self.cache_dir, exist_ok=True)
-        with open(self._path(key), "w") as f:
-            json.dump(value, f)
+        with open(self._path(key), "wb") as f:
+            f.write(payload)
 
     def clear(self):
         if os.path.exists(self.cache_dir):
@@ -70,11 +70,16 @@ def _can_use_native(expr_str: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=256)
 def compile_expr(expr_str: str):
     """Compile a filter/compute expression into a safe callable.
 
     Uses native C engine when available (20-50x faster).
     Falls back to Python AST evaluator for complex expressions.
+
+    Cached on the exact source string: steps and runs that use the same
+    expression text share one compiled callable (it holds no per-call
+    state, so sharing is safe).
     """
     if _can_use_native(expr_str):
         try:
@@ -97,18 +102,167 @@ def _parse_and_validate(expr_str: str) -> ast.Expression:
 
 
 def _compile_python(expr_str: str):
-    """Python AST-walking evaluator (fallback for complex expressions)."""
+    """Python evaluator (fallback for complex expressions).
+
+    v0.5.0: The validated AST is rewritten into a lambda over the row and
+    compiled to bytecode once, so each row costs a single call instead of
+    a recursive _eval_node walk. Syntax the rewrite doesn't cover keeps the
+    AST-walking evaluator; results are the same either way.
+    """
     tree = _parse_and_validate(expr_str)
 
-    def evaluator(row: dict):
-        try:
-            return _eval_node(tree.body, row)
-        except Exception:
-            return None
+    try:
+        fn = _compile_bytecode(tree)
+    except _Unsupported:
+        def evaluator(row: dict):
+            try:
+                return _eval_node(tree.body, row)
+            except Exception:
+                return None
+    else:
+        def evaluator(row: dict):
+            try:
+                return fn(row)
+            except Exception:
+                return None
 
     return evaluator
 
 
+class _Unsupported(Exception):
+    """Expression needs the AST-walking evaluator."""
+
+
+def _compare(op, left, right) -> bool:
+    """One comparison with _eval_node's rule: None on either side is False."""
+    return left is not None and right is not None and bool(op(left, right))
+
+
+# Globals of every compiled expression; field names never resolve here
+# because _to_bytecode_ast turns each Name into row.get("name")
+_BYTECODE_GLOBALS = {
+    "__builtins__": {},
+    "_compare": _compare,
+    "callable": callable,
+    **{f"_{op.__name__}": fn for op, fn in SAFE_OPS.items()},
+}
+
+
+def _compile_bytecode(tree: ast.Expression):
+    """Compile the expression into `lambda row: ...` with _eval_node semantics."""
+    body = _to_bytecode_ast(tree.body, [])
+    args = ast.arguments(
+        posonlyargs=[], args=[ast.arg(arg="row")], kwonlyargs=[],
+        kw_defaults=[], defaults=[],
+    )
+    lam = ast.fix_missing_locations(
+        ast.Expression(body=ast.Lambda(args=args, body=body))
+    )
+    return eval(compile(lam, "<expr>", "eval"), dict(_BYTECODE_GLOBALS))
+
+
+def _load(name: str) -> ast.Name:
+    return ast.Name(id=name, ctx=ast.Load())
+
+
+def _bind(temps: list[str], value: ast.expr) -> tuple[str, ast.NamedExpr]:
+    """(temp name, `temp := value`) so a value is evaluated only once."""
+    name = f"_t{len(temps)}"
+    temps.append(name)
+    return name, ast.NamedExpr(target=ast.Name(id=name, ctx=ast.Store()), value=value)
+
+
+def _to_bytecode_ast(node, temps: list[str]) -> ast.expr:
+    """Rewrite one node of a validated expression; see _eval_node."""
+    if isinstance(node, ast.Compare):
+        # Every comparator is tested against node.left, evaluated once
+        left = _to_bytecode_ast(node.left, temps)
+        if len(node.ops) > 1:
+            name, bound = _bind(temps, left)
+        tests = []
+        for i, (op, comparator) in enumerate(zip(node.ops, node.comparators)):
+            if type(op) not in SAFE_OPS:
+                raise _Unsupported
+            if len(node.ops) > 1:
+                left = bound if i == 0 else _load(name)
+            tests.append(ast.Call(
+                func=_load("_compare"),
+                args=[
+                    _load(f"_{type(op).__name__}"),
+                    left,
+                    _to_bytecode_ast(comparator, temps),
+                ],
+                keywords=[],
+            ))
+        return tests[0] if len(tests) == 1 else ast.BoolOp(op=ast.And(), values=tests)
+
+    if isinstance(node, ast.BoolOp):
+        # all()/any() semantics: short-circuit, then a bool result
+        values = [_to_bytecode_ast(v, temps) for v in node.values]
+        return ast.UnaryOp(op=ast.Not(), operand=ast.UnaryOp(
+            op=ast.Not(), operand=ast.BoolOp(op=node.op, values=values)
+        ))
+
+    if isinstance(node, ast.BinOp):
+        if type(node.op) not in SAFE_OPS:
+            raise _Unsupported
+        return ast.BinOp(
+            left=_to_bytecode_ast(node.left, temps),
+            op=node.op,
+            right=_to_bytecode_ast(node.right, temps),
+        )
+
+    if isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, (ast.Not, ast.USub)):
+            raise _Unsupported
+        return ast.UnaryOp(op=node.op, operand=_to_bytecode_ast(node.operand, temps))
+
+    if isinstance(node, ast.Name):
+        return ast.Call(
+            func=ast.Attribute(value=_load("row"), attr="get", ctx=ast.Load()),
+            args=[ast.Constant(value=node.id)],
+            keywords=[],
+        )
+
+    if isinstance(node, ast.Constant):
+        return ast.Constant(value=node.value)
+
+    if isinstance(node, ast.Attribute):
+        # None if obj is None else obj.attr
+        if node.attr not in SAFE_BUILTINS:
+            raise _Unsupported
+        name, bound = _bind(temps, _to_bytecode_ast(node.value, temps))
+        return ast.IfExp(
+            test=ast.Compare(left=bound, ops=[ast.Is()], comparators=[ast.Constant(value=None)]),
+            body=ast.Constant(value=None),
+            orelse=ast.Attribute(value=_load(name), attr=node.attr, ctx=ast.Load()),
+        )
+
+    if isinstance(node, ast.Call):
+        # func(*args) if callable(func) else None; keyword args are ignored
+        if any(isinstance(a, ast.Starred) for a in node.args):
+            raise _Unsupported
+        name, bound = _bind(temps, _to_bytecode_ast(node.func, temps))
+        return ast.IfExp(
+            test=ast.Call(func=_load("callable"), args=[bound], keywords=[]),
+            body=ast.Call(
+                func=_load(name),
+                args=[_to_bytecode_ast(a, temps) for a in node.args],
+                keywords=[],
+            ),
+            orelse=ast.Constant(value=None),
+        )
+
+    if isinstance(node, ast.IfExp):
+        return ast.IfExp(
+            test=_to_bytecode_ast(node.test, temps),
+            body=_to_bytecode_ast(node.body, temps),
+            orelse=_to_bytecode_ast(node.orelse, temps),
+        )
+
+    raise _Unsupported
+
+
 def _validate_ast(tree: ast.Expression):
     for node in ast.walk(tree):
         if isinstance(node, (ast.Import, ast.ImportFrom)):
@@ -121,58 +275,86 @@ def _validate_ast(tree: ast.Expression):
 
 
 def _eval_node(node, row):
-    if isinstance(node, ast.Compare):
-        left = _eval_node(node.left, row)
-        for op, comparator in zip(node.ops, node.comparators):
-            right = _eval_node(comparator, row)
-            if left is None or right is None:
-                return False
-            if not SAFE_OPS[type(op)](left, right):
-                return False
-        return True
+    """AST-walking evaluation: one dict lookup on type(node) per node."""
+    return _EVAL_HANDLERS.get(type(node), _eval_unsupported)(node, row)
 
-    if isinstance(node, ast.BoolOp):
-        if isinstance(node.op, ast.And):
-            return all(_eval_node(v, row) for v in node.values)
-        if isinstance(node.op, ast.Or):
-            return any(_eval_node(v, row) for v in node.values)
 
-    if isinstance(node, ast.BinOp):
-        left = _eval_node(node.left, row)
-        right = _eval_node(node.right, row)
-        return SAFE_OPS[type(node.op)](left, right)
+def _eval_compare(node, row):
+    left = _eval_node(node.left, row)
+    for op, comparator in zip(node.ops, node.comparators):
+        right = _eval_node(comparator, row)
+        if left is None or right is None:
+            return False
+        if not SAFE_OPS[type(op)](left, right):
+            return False
+    return True
 
-    if isinstance(node, ast.UnaryOp):
-        operand = _eval_node(node.operand, row)
-        if isinstance(node.op, ast.Not):
-            return not operand
-        if isinstance(node.op, ast.USub):
-            return -operand
 
-    if isinstance(node, ast.Name):
-        return row.get(node.id)
+def _eval_boolop(node, row):
+    if isinstance(node.op, ast.And):
+        return all(_eval_node(v, row) for v in node.values)
+    return any(_eval_node(v, row) for v in node.values)
 
-    if isinstance(node, ast.Constant):
-        return node.value
 
-    if isinstance(node, ast.Attribute):
-        obj = _eval_node(node.value, row)
-        if obj is None:
-            return None
-        attr = node.attr
-        if attr not in SAFE_BUILTINS:
-            raise ExpressionError(f"Attribute '{attr}' not allowed")
-        return getattr(obj, attr)
+def _eval_binop(node, row):
+    left = _eval_node(node.left, row)
+    right = _eval_node(node.right, row)
+    return SAFE_OPS[type(node.op)](left, right)
 
-    if isinstance(node, ast.Call):
-        func = _eval_node(node.func, row)
-        if not callable(func):
-            return None
-        args = [_eval_node(a, row) for a in node.args]
-        return func(*args)
 
-    if isinstance(node, ast.IfExp):
-        test = _eval_node(node.test, row)
-        return _eval_node(node.body, row) if test else _eval_node(node.orelse, row)
+def _eval_unaryop(node, row):
+    operand = _eval_node(node.operand, row)
+    if isinstance(node.op, ast.Not):
+        return not operand
+    if isinstance(node.op, ast.USub):
+        return -operand
+    return _eval_unsupported(node, row)
+
+
+def _eval_name(node, row):
+    return row.get(node.id)
+
+
+def _eval_constant(node, row):
+    return node.value
+
+
+def _eval_attribute(node, row):
+    obj = _eval_node(node.value, row)
+    if obj is None:
+        return None
+    attr = node.attr
+    if attr not in SAFE_BUILTINS:
+        raise ExpressionError(f"Attribute '{attr}' not allowed")
+    return getattr(obj, attr)
+
 
+def _eval_call(node, row):
+    func = _eval_node(node.func, row)
+    if not callable(func):
+        return None
+    args = [_eval_node(a, row) for a in node.args]
+    return func(*args)
+
+
+def _eval_ifexp(node, row):
+    test = _eval_node(node.test, row)
+    return _eval_node(node.body, row) if test else _eval_node(node.orelse, row)
+
+
+def _eval_unsupported(node, row):
     raise ExpressionError(f"Unsupported expression: {type(node).__name__}")
+
+
+_EVAL_HANDLERS = {
+    ast.Compare: _eval_compare,
+    ast.BoolOp: _eval_boolop,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unaryop,
+    ast.Name: _eval_name,
+    ast.Constant: _eval_constant,
+    ast.Attribute: _eval_attribute,
+    ast.Call: _eval_call,
+    ast.IfExp: _eval_ifexp,
+}
+
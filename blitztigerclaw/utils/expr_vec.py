@@ -0,0 +1,270 @@
+"""Vectorized evaluation of numeric filter/compute expressions.
+
+The per-row evaluators in utils.expr handle every expression; this module
+takes over for large batches of purely numeric columns, where whole-column
+NumPy (or numexpr) operations give the same results far faster.
+
+Most of the time goes into building the column arrays from row dicts;
+numexpr already evaluates the expression itself in one compiled pass, so
+a JIT backend (e.g. Numba) would only add compile time.
+"""
+
+import ast
+import math
+import operator
+from functools import reduce
+
+from blitztigerclaw.utils.expr import SAFE_OPS, _parse_and_validate
+
+try:
+    import numpy as np
+    _NUMPY = True
+except ImportError:
+    _NUMPY = False
+
+try:
+    import numexpr
+    _NUMEXPR = True
+except ImportError:
+    _NUMEXPR = False
+
+# Below this many rows, building arrays costs more than the per-row evaluator
+VECTOR_MIN_ROWS = 10_000
+
+# Magnitude up to which int64/float64 results match Python numbers exactly
+_EXACT_BOUND = 2 ** 53
+
+_VECTOR_BINOPS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul}
+_VECTOR_CMPOPS = (ast.Gt, ast.Lt, ast.GtE, ast.LtE, ast.Eq, ast.NotEq)
+
+_BIN_SYMBOLS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*"}
+_CMP_SYMBOLS = {
+    ast.Gt: ">", ast.Lt: "<", ast.GtE: ">=",
+    ast.LtE: "<=", ast.Eq: "==", ast.NotEq: "!=",
+}
+_BOOL, _NUMBER = "bool", "number"
+
+
+def vector_worthwhile(row_count: int) -> bool:
+    """Whether a batch this size can take the vectorized path at all."""
+    return _NUMPY and row_count >= VECTOR_MIN_ROWS
+
+
+def vector_eval(expr_str: str, data: list[dict]) -> list | None:
+    """Evaluate an expression over every row at once.
+
+    Returns one value per row, equal to what the per-row evaluator gives,
+    or None when the expression or data doesn't qualify.
+    """
+    result = _vector_result(expr_str, data)
+    return None if result is None else result.tolist()
+
+
+def vector_filter(expr_str: str, data: list[dict]) -> list[dict] | None:
+    """Rows of data for which the expression is truthy (in order), gathered
+    by index from the result mask; None when the expression or data
+    doesn't qualify."""
+    result = _vector_result(expr_str, data)
+    if result is None:
+        return None
+    return [data[i] for i in np.flatnonzero(result).tolist()]
+
+
+def _vector_result(expr_str: str, data: list[dict]):
+    """Result array for the expression over all rows, or None.
+
+    Covers field names, int/float constants, + - *, unary minus,
+    comparisons and and/or/not, over columns that hold only ints or only
+    floats in every row. None when numpy is missing, there are too few
+    rows, other syntax is used, values are missing/None/non-numeric, or
+    magnitudes are large enough for int64/float64 to diverge from Python.
+    numexpr evaluates the whole expression in one pass when installed and
+    the expression has no arithmetic on booleans; NumPy ufuncs otherwise.
+    """
+    if not vector_worthwhile(len(data)):
+        return None
+    tree = _parse_and_validate(expr_str)
+    names: set[str] = set()
+    if not _vectorizable(tree.body, names) or not names:
+        return None
+
+    columns = {}
+    for name in names:
+        column = _numeric_column(data, name)
+        if column is None:
+            return None
+        columns[name] = column
+    if not _bound(tree.body, columns) <= _EXACT_BOUND:
+        return None
+
+    result = None
+    source = _numexpr_source(tree.body, None) if _NUMEXPR else None
+    if source is not None:
+        try:
+            result = numexpr.evaluate(
+                source, local_dict={f"c_{n}": col for n, (col, _) in columns.items()}
+            )
+        except Exception:
+            pass  # e.g. a field name numexpr can't parse
+    if result is None:
+        result = _vector_node(tree.body, columns)
+    return np.broadcast_to(result, len(data))
+
+
+def _vectorizable(node, names: set[str]) -> bool:
+    if isinstance(node, ast.Name):
+        names.add(node.id)
+        return True
+    if isinstance(node, ast.Constant):
+        return type(node.value) in (int, float)
+    if isinstance(node, ast.BinOp):
+        return (
+            type(node.op) in _VECTOR_BINOPS
+            and _vectorizable(node.left, names)
+            and _vectorizable(node.right, names)
+        )
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.USub, ast.Not)) and _vectorizable(
+            node.operand, names
+        )
+    if isinstance(node, ast.BoolOp):
+        return all(_vectorizable(v, names) for v in node.values)
+    if isinstance(node, ast.Compare):
+        return (
+            all(isinstance(op, _VECTOR_CMPOPS) for op in node.ops)
+            and _vectorizable(node.left, names)
+            and all(_vectorizable(c, names) for c in node.comparators)
+        )
+    return False
+
+
+def _numeric_column(data: list[dict], name: str):
+    """(array, max |value|) for a column of all-int or all-float values."""
+    values = [row.get(name) for row in data]
+    types = set(map(type, values))
+    if types == {int}:
+        dtype = np.int64
+    elif types == {float}:
+        dtype = np.float64
+    else:
+        return None  # missing, None, bool, str or mixed int/float
+    try:
+        array = np.array(values, dtype=dtype)
+    except OverflowError:
+        return None
+    largest = float(np.nanmax(np.abs(array))) if not np.isnan(array).all() else 0.0
+    return array, largest
+
+
+def _bound(node, columns: dict) -> float:
+    """Upper bound on |value| of node and all its subexpressions."""
+    if isinstance(node, ast.Name):
+        return columns[node.id][1]
+    if isinstance(node, ast.Constant):
+        return abs(node.value) if not math.isnan(node.value) else 0.0
+    if isinstance(node, ast.BinOp):
+        left, right = _bound(node.left, columns), _bound(node.right, columns)
+        combined = left * right if isinstance(node.op, ast.Mult) else left + right
+        return max(left, right, combined)
+    if isinstance(node, ast.UnaryOp):
+        return max(_bound(node.operand, columns), 1)
+    children = (
+        node.values if isinstance(node, ast.BoolOp)
+        else [node.left, *node.comparators]
+    )
+    return max(1, *(_bound(c, columns) for c in children))
+
+
+def _as_number(value):
+    """Python arithmetic treats bools as 0/1 ints; so must the arrays."""
+    value = np.asarray(value)
+    return value.astype(np.int64) if value.dtype == np.bool_ else value
+
+
+def _vector_node(node, columns: dict):
+    if isinstance(node, ast.Name):
+        return columns[node.id][0]
+
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    if isinstance(node, ast.BinOp):
+        return _VECTOR_BINOPS[type(node.op)](
+            _as_number(_vector_node(node.left, columns)),
+            _as_number(_vector_node(node.right, columns)),
+        )
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _vector_node(node.operand, columns)
+        if isinstance(node.op, ast.Not):
+            return np.logical_not(operand)
+        return -_as_number(operand)
+
+    if isinstance(node, ast.BoolOp):
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return reduce(combine, (_vector_node(v, columns) for v in node.values))
+
+    # Compare: like _eval_node, every comparator is tested against node.left
+    left = _vector_node(node.left, columns)
+    result = None
+    for op, comparator in zip(node.ops, node.comparators):
+        test = SAFE_OPS[type(op)](left, _vector_node(comparator, columns))
+        result = test if result is None else np.logical_and(result, test)
+    return result
+
+
+def _numexpr_source(node, want: str | None) -> str | None:
+    """numexpr source for a node, coerced to a boolean (want=_BOOL, by
+    Python truthiness) or required to be a number (_NUMBER); want=None
+    keeps the node's own type. None if numexpr would differ from Python
+    (booleans used as numbers, or constant-only boolean parts, which
+    numexpr folds into plain ints)."""
+    boolean = isinstance(node, (ast.Compare, ast.BoolOp)) or (
+        isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not)
+    )
+    if (boolean or want == _BOOL) and not any(
+        isinstance(n, ast.Name) for n in ast.walk(node)
+    ):
+        return None
+    if boolean:
+        if want == _NUMBER:
+            return None  # bools in arithmetic: numexpr has no bool->int
+        if isinstance(node, ast.Compare):
+            # Like _eval_node, every comparator is tested against node.left
+            left = _numexpr_source(node.left, _NUMBER)
+            tests = []
+            for op, comparator in zip(node.ops, node.comparators):
+                right = _numexpr_source(comparator, _NUMBER)
+                if left is None or right is None:
+                    return None
+                tests.append(f"({left} {_CMP_SYMBOLS[type(op)]} {right})")
+            return "(" + " & ".join(tests) + ")"
+        if isinstance(node, ast.BoolOp):
+            parts = [_numexpr_source(v, _BOOL) for v in node.values]
+            if None in parts:
+                return None
+            joiner = " & " if isinstance(node.op, ast.And) else " | "
+            return "(" + joiner.join(parts) + ")"
+        operand = _numexpr_source(node.operand, _BOOL)
+        return None if operand is None else f"(~{operand})"
+
+    # Numeric node
+    if isinstance(node, ast.Name):
+        source = f"c_{node.id}"
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, float) and not math.isfinite(node.value):
+            return None
+        source = repr(node.value)
+    elif isinstance(node, ast.BinOp):
+        left = _numexpr_source(node.left, _NUMBER)
+        right = _numexpr_source(node.right, _NUMBER)
+        if left is None or right is None:
+            return None
+        source = f"({left} {_BIN_SYMBOLS[type(node.op)]} {right})"
+    else:  # unary minus
+        operand = _numexpr_source(node.operand, _NUMBER)
+        if operand is None:
+            return None
+        source = f"(-{operand})"
+    # Truthiness of a number, as Python's bool() sees it (nan is truthy)
+    return f"({source} != 0)" if want == _BOOL else source
@@ -0,0 +1,68 @@
+"""JSON encoding shared by file writers, checkpoints, caches and metrics.
+
+Uses orjson when installed, and the stdlib json module otherwise or for
+values orjson rejects (e.g. ints beyond 64 bits). datetime/date/time and
+dataclass instances are handed to `default`, as the stdlib does, so with
+default=str they are written as str(value).
+
+The orjson output still differs from json.dumps(..., default=str) in a few
+ways:
+- NaN and Infinity are written as null (the stdlib writes NaN/Infinity,
+  which is not valid JSON)
+- Enum members are written as their value, not str(member)
+- numpy arrays and scalars are written as lists/numbers, not str(array)
+- non-ASCII text is written as UTF-8 instead of \\u escapes, and
+  whitespace and float spelling differ (0.00001 vs 1e-05); values are equal
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+    _ORJSON = True
+except ImportError:
+    _ORJSON = False
+
+if _ORJSON:
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Encode obj as JSON bytes, compact or indented by two spaces.
+
+    Without `default`, unsupported values raise TypeError as with the stdlib.
+    """
+    if _ORJSON:
+        option = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits: let the stdlib handle it
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str."""
+    if _ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: str, data: Any):
+    """Write data to path as indented JSON, with str() for values JSON
+    can't represent. Encoded first, then written in one call."""
+    payload = dumps(data, indent=True, default=str)
+    with open(path, "wb") as f:
+        f.write(payload)
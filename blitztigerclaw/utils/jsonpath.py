@@ -1,3 +1,7 @@
+import functools
+from typing import Any, Callable
+
+
 def jsonpath_extract(data, path: str):
     """Extract data using simplified JSONPath notation.
 
@@ -11,6 +15,17 @@ def jsonpath_extract(data, path: str):
         jsonpath_extract({"data": {"items": [1,2,3]}}, "$.data.items") -> [1,2,3]
         jsonpath_extract([{"a": 1}, {"a": 2}], "$[*].a") -> [1, 2]
     """
+    return jsonpath_compile(path)(data)
+
+
+@functools.lru_cache(maxsize=256)
+def jsonpath_compile(path: str) -> Callable[[Any], Any]:
+    """Parse `path` once and return a function that extracts it from data.
+
+    jsonpath_compile(path)(data) == jsonpath_extract(data, path); callers
+    that apply one path to many documents (e.g. every fetched response)
+    compile it up front instead of re-splitting the path per document.
+    """
     if not path.startswith("$"):
         raise ValueError(f"JSONPath must start with '$': {path}")
 
@@ -20,35 +35,46 @@ def jsonpath_extract(data, path: str):
         remainder = remainder[1:]
 
     if not remainder:
-        return data
+        return _identity
 
-    parts = _split_path(remainder)
-    current = data
+    # (is_wildcard, key) per path segment
+    parts = tuple(
+        (part == "*" or part == "[*]", part) for part in _split_path(remainder)
+    )
 
-    for part in parts:
-        if current is None:
-            return None
+    def extract(data):
+        current = data
 
-        if part == "*" or part == "[*]":
-            if not isinstance(current, list):
+        for wildcard, part in parts:
+            if current is None:
                 return None
-            continue
-
-        if isinstance(current, list):
-            # Apply field extraction to each item in the list
-            current = [
-                item.get(part) if isinstance(item, dict) else None
-                for item in current
-            ]
-            # Flatten nested lists
-            if current and isinstance(current[0], list):
-                current = [x for sublist in current if sublist for x in sublist]
-        elif isinstance(current, dict):
-            current = current.get(part)
-        else:
-            return None
 
-    return current
+            if wildcard:
+                if not isinstance(current, list):
+                    return None
+                continue
+
+            if isinstance(current, list):
+                # Apply field extraction to each item in the list
+                current = [
+                    item.get(part) if isinstance(item, dict) else None
+                    for item in current
+                ]
+                # Flatten nested lists
+                if current and isinstance(current[0], list):
+                    current = [x for sublist in current if sublist for x in sublist]
+            elif isinstance(current, dict):
+                current = current.get(part)
+            else:
+                return None
+
+        return current
+
+    return extract
+
+
+def _identity(data):
+    return data
 
 
 def _split_path(path: str) -> list[str]:
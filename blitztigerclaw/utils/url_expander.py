@@ -1,4 +1,10 @@
 import re
+from typing import Iterator
+
+_RANGE_RE = re.compile(r"\{(\d+)\.\.(\d+)\}")
+_LIST_RE = re.compile(r"\{([^}]+)\}")
+# A {name} placeholder; names are looked up as-is, so any key without braces
+_VAR_RE = re.compile(r"\{([^{}]+)\}")
 
 
 def expand_url_pattern(pattern: str) -> list[str]:
@@ -9,30 +15,42 @@ def expand_url_pattern(pattern: str) -> list[str]:
         "https://api.com/{a,b,c}/data" -> 3 URLs
         "https://api.com/static" -> ["https://api.com/static"]
     """
+    return list(iter_expand_url_pattern(pattern))
+
+
+def iter_expand_url_pattern(pattern: str) -> Iterator[str]:
+    """Lazy form of expand_url_pattern: the pattern is parsed once and URLs
+    are generated on demand, so "{1..1000000}" never builds a list.
+    """
+    if "{" not in pattern:
+        return iter((pattern,))
+
     # Handle {start..end} range patterns
-    range_match = re.search(r"\{(\d+)\.\.(\d+)\}", pattern)
+    range_match = _RANGE_RE.search(pattern)
     if range_match:
         start = int(range_match.group(1))
         end = int(range_match.group(2))
         prefix = pattern[: range_match.start()]
         suffix = pattern[range_match.end() :]
-        return [f"{prefix}{i}{suffix}" for i in range(start, end + 1)]
+        return (f"{prefix}{i}{suffix}" for i in range(start, end + 1))
 
     # Handle {a,b,c} list patterns
-    list_match = re.search(r"\{([^}]+)\}", pattern)
+    list_match = _LIST_RE.search(pattern)
     if list_match and "," in list_match.group(1):
         items = [item.strip() for item in list_match.group(1).split(",")]
         prefix = pattern[: list_match.start()]
         suffix = pattern[list_match.end() :]
-        return [f"{prefix}{item}{suffix}" for item in items]
+        return (f"{prefix}{item}{suffix}" for item in items)
 
-    return [pattern]
+    return iter((pattern,))
 
 
 def expand_vars(text: str, variables: dict) -> str:
     """Replace {var_name} placeholders with values from variables dict.
 
-    Also expands $ENV_VAR and ${ENV_VAR} from environment.
+    Also expands $ENV_VAR and ${ENV_VAR} from environment. Placeholders
+    are substituted in one pass; values are inserted as-is, not expanded
+    again, and unknown names (e.g. {1..5} ranges) are left in place.
     """
     import os
 
@@ -40,7 +58,11 @@ def expand_vars(text: str, variables: dict) -> str:
     result = os.path.expandvars(text)
 
     # Then expand pipeline variables (skip range/list patterns)
-    for key, value in variables.items():
-        result = result.replace(f"{{{key}}}", str(value))
+    if not variables or "{" not in result:
+        return result
+
+    def substitute(m: re.Match) -> str:
+        name = m.group(1)
+        return str(variables[name]) if name in variables else m.group(0)
 
-    return result
+    return _VAR_RE.sub(substitute, result)